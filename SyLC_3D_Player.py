@@ -220,7 +220,7 @@ import atexit
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
-    QFileDialog, QMessageBox, QGraphicsOpacityEffect, QStackedLayout,
+    QFileDialog, QMessageBox, QStackedLayout,
 )
 
 _SYLC_LOG_DIR = os.path.join(
@@ -715,16 +715,17 @@ configure_app_base_dir(APP_BASE_DIR)
 
 
 
-# GLOBAL ThreadPool for parallel thumbnail extraction (max 2 workers)
+# Thumbnail policy + extraction helpers (the pipeline itself lives in
+# sylc.time_slider; the live widget is PremiumTimelineSlider).
 from sylc.time_slider import (
-    TimeSlider, _decide_thumbs_mode, _extract_thumbnail_ffmpeg,
+    _decide_thumbs_mode, _extract_thumbnail_ffmpeg, shutdown_preview_mpv,
 )
 
 
 
 
 # Re-export auxiliary widgets for compatibility with existing imports.
-from sylc.player_widgets import IconButton, InfoOverlay, LoadingOverlay, PreviewTooltip
+from sylc.player_widgets import InfoOverlay, LoadingOverlay
 
 
 
@@ -811,6 +812,13 @@ class PlayerWindow(
     mpv_time_event = Signal(object)
     mpv_pause_event = Signal(object)
     mpv_eof_event = Signal(object)
+    mpv_track_list_event = Signal(object)
+
+    # Display names for the 3D notifications (shared with the loading path).
+    _MODE_NAMES = {'mvc': 'MultiView', 'sbs': 'Side-by-Side', 'tab': 'Top-Bottom'}
+    # Emitted by the mpv-init worker thread once the core handle exists (or
+    # failed); the GUI-thread slot performs the actual adoption.
+    mpv_core_created = Signal(object)
 
     def __init__(self, parent=None):
         print("[STARTUP] Initializing PlayerWindow...")
@@ -839,6 +847,12 @@ class PlayerWindow(
         self.video_widget = QWidget()
         self.video_widget.setAttribute(Qt.WidgetAttribute.WA_DontCreateNativeAncestors)
         self.video_widget.setAttribute(Qt.WidgetAttribute.WA_NativeWindow)
+        # mpv owns every pixel of this surface (the stylesheet paints the rest
+        # black before a core attaches), so let Qt skip the backing-store
+        # erase before each paint — the erase also caused a grey flash when
+        # resizing over live video.
+        self.video_widget.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.video_widget.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         self.video_widget.setStyleSheet("background-color: black;")
 
         self.video_stack.addWidget(self.video_widget)  # Index 0: MPV
@@ -865,6 +879,8 @@ class PlayerWindow(
         self.mpv_time_event.connect(self._dispatch_mpv_time)
         self.mpv_pause_event.connect(self._dispatch_mpv_pause)
         self.mpv_eof_event.connect(self._dispatch_mpv_eof)
+        self.mpv_track_list_event.connect(self._dispatch_mpv_track_list)
+        self.mpv_core_created.connect(self._on_mpv_core_created)
 
         # --- Controls Overlay (Floating) ---
         # Reparent to self (QMainWindow) to ensure it sits above the Central Widget
@@ -957,6 +973,8 @@ class PlayerWindow(
         self._mpv_time_pos_cache = None
         self._mpv_time_pos_cache_mono = None
         self._mpv_pause_cache = True
+        # Last time-pos forwarded to the GUI thread (10 Hz throttle gate).
+        self._last_time_update = 0.0
 
         # V60: persisted per-install settings (currently: the A/V sync trim set
         # with [ and ] — re-applied to every new decoder thread).
@@ -1205,6 +1223,7 @@ class PlayerWindow(
         # the bar; no movement for 3 s (playing) / 5 s (paused) hides it.
         self._nav_last_cursor = QCursor.pos()
         self._nav_last_activity = time.monotonic()
+        self._nav_last_show_probe = 0.0  # debounces _mark_activity's visibility probe
         self._nav_had_media = False
         self._nav_poll = QTimer(self)
         self._nav_poll.setInterval(120)
@@ -1299,12 +1318,17 @@ class PlayerWindow(
             QTimer.singleShot(5000, lambda: self.controls_overlay.set_status_info("Ready"))
 
 
+    def _set_volume(self, volume):
+        """Bound-method volume route (no per-event lambda frame)."""
+        if self.player is not None:
+            self.player.volume = volume
+
     def _connect_signals(self):
         """Connects UI signals to player commands."""
         self.controls_overlay.play_toggled.connect(self.toggle_play)
         self.controls_overlay.stop_clicked.connect(self.stop_playback)
         self.controls_overlay.fullscreen_toggled.connect(self.toggle_fullscreen)
-        self.controls_overlay.volume_changed.connect(lambda v: setattr(self.player, 'volume', v))
+        self.controls_overlay.volume_changed.connect(self._set_volume)
         
         # --- Seek on Release Implementation ---
         # Disconnect old 'seeked' signal which fired on mouse press/click
@@ -1465,16 +1489,16 @@ class PlayerWindow(
         if self.has_media:
             self.configure_3d_output(enabled, self.current_stereo_mode)
             if self.video_3d_info and self.video_3d_info['is_3d']:
-                mode_names = {'mvc': 'MultiView', 'sbs': 'Side-by-Side', 'tab': 'Top-Bottom'}
                 stereo_mode = self.video_3d_info['stereo_mode']
+                mode_label = self._MODE_NAMES.get(stereo_mode, stereo_mode.upper())
                 if enabled:
                     self.show_3d_notification(
-                        f"3D File: {mode_names.get(stereo_mode, stereo_mode.upper())} - 3D Playback Active",
+                        f"3D File: {mode_label} - 3D Playback Active",
                         success=True, permanent=True
                     )
                 else:
                     self.show_3d_notification(
-                        f"3D File: {mode_names.get(stereo_mode, stereo_mode.upper())} - Downgraded to 2D",
+                        f"3D File: {mode_label} - Downgraded to 2D",
                         success=False, permanent=True
                     )
             else:
@@ -2139,6 +2163,10 @@ class PlayerWindow(
                 self._thumb_service.shutdown()
             except Exception:
                 pass
+        # The legacy preview path keeps one headless mpv instance across
+        # hovers; like the mpv core below, it must release its file handle
+        # before any ISO dismount.
+        shutdown_preview_mpv()
         self._stop_mvc_decoder()
         # A Stop shortly before this close may have left a detached core
         # cooling toward its deferred terminate — its timer will never fire
@@ -148,7 +148,7 @@ class MediaLoadingMixin:
         # happened after ISO resolution and retried the temporary D:\... feature
         # path, losing ownership of the mount on the second call.
         if not self.player:
-            print("Player not ready, retrying...")
+            logger.info("Player not ready, retrying...")
             QTimer.singleShot(
                 100,
                 lambda: self._retry_play_file_when_ready(
@@ -373,12 +373,15 @@ class MediaLoadingMixin:
 
         # CRITICAL STABILITY: Stop MPV first to release file handles and video output
         # V61 STABILITY: if a previous stop_playback terminated mpv and its async
-        # re-init hasn't fired yet, re-create it SYNCHRONOUSLY now — the whole load
-        # path assumes a live player (the duplicate-init guard in _setup_mpv_player
-        # makes the pending timer a no-op afterwards).
+        # re-init hasn't fired yet, re-create it SYNCHRONOUSLY now (sync=True builds
+        # and adopts the core before returning) — the whole load path assumes a live
+        # player: self.player.stop() below and the "mpv core is unavailable" check in
+        # _continue_play_file_owned both fire well inside the async build's window.
+        # The instance-alive guard in _setup_mpv_player makes any pending async
+        # re-init a no-op afterwards.
         if self.player is None:
             logger.info("[LOAD] MPV instance not alive (post-stop) — synchronous re-init")
-            self._setup_mpv_player()
+            self._setup_mpv_player(sync=True)
         if self.player:
             try:
                 self.player.stop()
@@ -482,7 +485,7 @@ class MediaLoadingMixin:
 
         # STEP 1: Quick analysis to detect if MVC (DON'T start decoder yet!)
         self.loading_overlay.set_status("Analyzing 3D structure...")
-        self.video_3d_info = Video3DAnalyzer.analyze_file(file_path)
+        self.video_3d_info = Video3DAnalyzer.analyze_file_cached(file_path)
         is_mvc = self.video_3d_info.get('stereo_mode') == 'mvc'
         self._mvc_file_detected = is_mvc
 
@@ -712,8 +715,8 @@ class MediaLoadingMixin:
                 self._playback_timer.start()  # Override pause behavior
             self.update_ui_state()
 
-            self._media_single_shot(500, lambda: self.load_audio_tracks(owner), owner)
-            self._media_single_shot(500, lambda: self.load_subtitle_tracks(owner), owner)
+            # Track combos populate from the track-list observer installed
+            # above (_dispatch_mpv_track_list) — no fixed post-load delay.
 
             # V7b TIMELINE FIX: Sync timeline BEFORE starting playback
             # Update timeline with MPV duration and THEN start playback to ensure correct scale
@@ -887,7 +890,7 @@ class MediaLoadingMixin:
         """Analyzes the file and automatically configures the 3D mode."""
         # Skip re-analysis if already done (e.g., in _continue_play_file for PGS extraction)
         if not self.video_3d_info:
-            self.video_3d_info = Video3DAnalyzer.analyze_file(file_path)
+            self.video_3d_info = Video3DAnalyzer.analyze_file_cached(file_path)
 
         # DF-4: BD3D backup WITHOUT SSIF interleave (MakeMKV: base + dependent views in
         # SEPARATE .m2ts, no interleaved .ssif). find_feature paired them into
@@ -957,9 +960,9 @@ class MediaLoadingMixin:
             # below keeps following the detected CONTENT mode regardless.
             _choose = getattr(self, '_choose_initial_stereo_mode', None)
             ui_mode = _choose(stereo_mode) if _choose else stereo_mode
-            mode_index = {'mvc': 0, 'sbs': 1, 'tab': 2, 'dual': 3,
-                          'glasses': 4}.get(ui_mode, 0)
-            self.controls_overlay.stereo_mode_combo.setCurrentIndex(mode_index)
+            mode_index = self.controls_overlay.stereo_mode_combo.findData(ui_mode)
+            self.controls_overlay.stereo_mode_combo.setCurrentIndex(
+                mode_index if mode_index >= 0 else 0)
             # A REMEMBERED pick must be latched even when the combo was already
             # showing it (setCurrentIndex emits nothing then — measured: the
             # replay booted with the right combo but current_stereo_mode stuck
@@ -967,8 +970,8 @@ class MediaLoadingMixin:
             if ((getattr(self, '_file_memory', None) or {}).get('stereo_mode') == ui_mode
                     and self.current_stereo_mode != ui_mode):
                 self.change_stereo_mode(ui_mode)
-            mode_names = {'mvc': 'MultiView', 'sbs': 'Side-by-Side', 'tab': 'Top-Bottom'}
-            self.show_3d_notification(f"3D File: {mode_names.get(stereo_mode, stereo_mode.upper())}", success=True,
+            mode_label = self._MODE_NAMES.get(stereo_mode, stereo_mode.upper())
+            self.show_3d_notification(f"3D File: {mode_label}", success=True,
                                       permanent=True)
 
             # Always start MVC decoder for MVC content (required for SSIF 2D playback)
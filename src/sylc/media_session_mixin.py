@@ -222,6 +222,8 @@ class MediaSessionMixin:
              self.on_pause_state_change(name, value, s, c)),
             ('eof-reached', lambda name, value, s=session_id, c=core:
              self.on_end_of_file(name, value, s, c)),
+            ('track-list', lambda name, value, s=session_id, c=core:
+             self.on_track_list_change(name, value, s, c)),
         )
         installed = []
         try:
@@ -240,8 +242,15 @@ class MediaSessionMixin:
         logger.info("[MPV] Media observers attached to session #%d", session_id)
         return True
 
-    def _setup_mpv_player(self):
-        """Advanced MPV configuration with 3D support."""
+    def _setup_mpv_player(self, sync=False):
+        """Advanced MPV configuration with 3D support.
+
+        sync=True builds the core on the calling (GUI) thread and adopts it
+        before returning — the mid-load re-init path needs a live player
+        immediately (play_file stops it, then _continue_play_file_owned
+        aborts the whole load if self.player is still None 500 ms later).
+        The default stays asynchronous: startup and post-stop re-inits keep
+        the DLL load + d3d11 context build off the GUI thread."""
         if not self.video_widget.winId():
             logger.warning("winId not available, retrying in 100ms.")
             QTimer.singleShot(100, self._setup_mpv_player)
@@ -268,23 +277,20 @@ class MediaSessionMixin:
             # === D3D11 FULLSCREEN PERFORMANCE ===
             # Triple buffering for smooth fullscreen playback
             'd3d11-flip': 'no',                     # Disable flip model for smooth windowed HDR
-            'd3d11-sync-interval': 1,               # VSync on (1 frame)
             'swapchain-depth': 3,                   # Triple buffering
             'd3d11-exclusive-fs': 'no',             # CRITICAL: Disable exclusive fullscreen to preserve HDR
 
             # === HDR PASSTHROUGH CONFIGURATION ===
-            # Force PQ swapchain for HDR preservation
+            # Force PQ swapchain for HDR preservation. target-trc/prim/peak
+            # and tone-mapping stay at mpv's own 'auto' defaults — re-stating
+            # defaults just churned the property tree at init.
             'd3d11-output-csp': 'pq',
+            # NOT a default: mpv ships --dither-depth=no; without this the
+            # temporal-dither below is inert and 8-bit output paths band.
+            'dither-depth': 'auto',
             'target-colorspace-hint': 'yes',
-            # Let MPV auto-detect HDR capabilities
-            'target-trc': 'auto',
-            'target-prim': 'auto',
-            'target-peak': 'auto',
-            # Only tone-map if display doesn't support HDR
-            'tone-mapping': 'auto',
             'hdr-compute-peak': 'yes',
             'video-output-levels': 'full',
-            'dither-depth': 'auto',
             # Ensure proper GPU processing for HDR
             'gpu-dumb-mode': 'no',
 
@@ -338,7 +344,6 @@ class MediaSessionMixin:
             # exception traffic and their startup cost.
             'load-scripts': 'no',
             'volume': 100,
-            'mute': 'no',
             # The subtitle combo starts on "None". Prevent mpv from silently
             # auto-selecting an embedded track behind that UI state.
             'sid': 'no',
@@ -351,54 +356,94 @@ class MediaSessionMixin:
         # finish the old release NOW (cheap once settled) before creating.
         self._drain_dying_core()
 
-        try:
-            if MPV_MODULE is None:
-                raise RuntimeError("python-mpv support has not been configured")
-            self.player = MPV_MODULE.MPV(**mpv_config)
-            self.player['msg-level'] = 'all=info'
-            logger.info("MPV instance created successfully.")
-            self._vu_timer.start()   # begin polling audio levels for the VU meter
-
-            # FIX: Delay property observers to let MPV event thread fully initialize
-            # This prevents the "Windows fatal exception: code 0xe24c4a02" error
-            core = self.player
-
-            def _setup_observers(owner=core):
-                try:
-                    # Check that this delayed setup still belongs to the created core.
-                    if owner is self.player:
-                        # VU meter (observer→cache, the RIGHT way): attach the astats
-                        # filter (label 'vu') ONCE and observe af-metadata/vu. The
-                        # observer (on_vu_metadata) runs on mpv's EVENT thread and
-                        # pushes parsed levels into _vu_cache; the GUI-thread VU poll
-                        # only reads that plain attribute, never mpv. One persistent
-                        # mpv instance → the filter covers EVERY session incl.
-                        # audio-only mpv (MVC/HEVC/dual). Verified: the observer fires
-                        # ~10 Hz with real per-channel RMS/peak on a vid=no instance.
-                        self._ensure_vu_af()
-                        owner.observe_property('af-metadata/vu', self.on_vu_metadata)
-                        self.controls_overlay.time_slider.set_player(owner)
-                        self._mpv_subtext_observer_registered = False
-                        self._mpv_subtext_observer = None
-                        logger.info("[MPV] Persistent core observers connected.")
-                except Exception as e:
-                    logger.warning(f"[MPV] Could not set up observers (safe to ignore): {e}")
-
-            QTimer.singleShot(100, _setup_observers)  # 100ms delay
-        except Exception as e:
-            logger.error(f"Error initializing mpv or observers: {e}")
-            # Never leave a partially configured core behind: the duplicate-core
-            # guard would otherwise preserve it forever without observers.
-            failed_core = getattr(self, 'player', None)
+        # The constructor loads mpv-2.dll and builds the d3d11 context —
+        # hundreds of milliseconds that used to block first paint. Build the
+        # handle on a worker and adopt it on the GUI thread (mpv_core_created);
+        # pre-session loads already poll via _retry_play_file_when_ready, so a
+        # briefly-None self.player is an anticipated state.
+        if sync:
+            # Blocking build + inline adoption. An async init already in
+            # flight is NOT a reason to wait: if its core lands after ours,
+            # the self.player-is-set guard in _on_mpv_core_created discards
+            # and terminates the late arrival.
+            try:
+                if MPV_MODULE is None:
+                    raise RuntimeError("python-mpv support has not been configured")
+                core = MPV_MODULE.MPV(**mpv_config)
+            except Exception as exc:
+                self._on_mpv_core_created((None, exc))
+            else:
+                self._on_mpv_core_created((core, None))
+            return
+
+        if getattr(self, '_mpv_init_inflight', False):
+            logger.info("[MPV] _setup_mpv_player: init already in flight — skipping")
+            return
+        self._mpv_init_inflight = True
+
+        def _build_core():
+            try:
+                if MPV_MODULE is None:
+                    raise RuntimeError("python-mpv support has not been configured")
+                core = MPV_MODULE.MPV(**mpv_config)
+            except Exception as exc:
+                self.mpv_core_created.emit((None, exc))
+            else:
+                self.mpv_core_created.emit((core, None))
+
+        threading.Thread(target=_build_core, daemon=True,
+                         name='mpv-core-init').start()
+
+    @Slot(object)
+    def _on_mpv_core_created(self, payload):
+        """GUI-thread adoption of the worker-built mpv core."""
+        core, error = payload
+        self._mpv_init_inflight = False
+        if error is not None or core is None:
+            logger.error(f"Error initializing mpv or observers: {error}")
             self.player = None
-            if failed_core is not None:
-                try:
-                    failed_core.terminate()
-                except Exception:
-                    pass
             if not getattr(self, '_app_closing', False):
                 QMessageBox.critical(self, "MPV Error",
-                                     f"Error initializing mpv: {e}\n\nMake sure runtime/mpv-2.dll is installed.")
+                                     f"Error initializing mpv: {error}\n\nMake sure runtime/mpv-2.dll is installed.")
+            return
+        if getattr(self, '_app_closing', False) or self.player is not None:
+            # Shutdown began, or a core already exists (V61: never stack
+            # instances on the same wid HWND) — discard the late arrival.
+            try:
+                core.terminate()
+            except Exception:
+                pass
+            return
+
+        self.player = core
+        self.player['msg-level'] = 'all=info'
+        logger.info("MPV instance created successfully.")
+        self._vu_timer.start()   # begin polling audio levels for the VU meter
+
+        # FIX: Delay property observers to let MPV event thread fully initialize
+        # This prevents the "Windows fatal exception: code 0xe24c4a02" error
+        def _setup_observers(owner=core):
+            try:
+                # Check that this delayed setup still belongs to the created core.
+                if owner is self.player:
+                    # VU meter (observer→cache, the RIGHT way): attach the astats
+                    # filter (label 'vu') ONCE and observe af-metadata/vu. The
+                    # observer (on_vu_metadata) runs on mpv's EVENT thread and
+                    # pushes parsed levels into _vu_cache; the GUI-thread VU poll
+                    # only reads that plain attribute, never mpv. One persistent
+                    # mpv instance → the filter covers EVERY session incl.
+                    # audio-only mpv (MVC/HEVC/dual). Verified: the observer fires
+                    # ~10 Hz with real per-channel RMS/peak on a vid=no instance.
+                    self._ensure_vu_af()
+                    owner.observe_property('af-metadata/vu', self.on_vu_metadata)
+                    self.controls_overlay.time_slider.set_player(owner)
+                    self._mpv_subtext_observer_registered = False
+                    self._mpv_subtext_observer = None
+                    logger.info("[MPV] Persistent core observers connected.")
+            except Exception as e:
+                logger.warning(f"[MPV] Could not set up observers (safe to ignore): {e}")
+
+        QTimer.singleShot(100, _setup_observers)  # 100ms delay
 
     def on_end_of_file(self, _, reached, session_id=None, core=None):
         """mpv-thread callback: marshal EOF with immutable ownership metadata."""
@@ -94,7 +94,7 @@ class NativeDecoderMixin:
 
                     self.show_3d_notification("2D Mode (Left View)", success=True)
                 except Exception as e:
-                    print(f"Error switching to 2D: {e}")
+                    logger.error(f"Error switching to 2D: {e}")
                 
                 # Restore 2D navigation bar UI - AFTER stack switch and OS compositor updates
                 QTimer.singleShot(250, lambda: (self._update_overlays_geometry(), self.show_controls()))
@@ -224,7 +224,7 @@ class NativeDecoderMixin:
                         self.show_3d_notification(f"3D Mode: {stereo_mode.upper()} (Main Window)", success=True)
 
             except Exception as e:
-                print(f"Error configuring MVC decoder: {e}")
+                logger.error(f"Error configuring MVC decoder: {e}")
                 self._fallback_to_mpv_mvc()
         else:
             # --- Native SBS/TAB files (non-MVC) - use MPV in main window ---
@@ -282,7 +282,7 @@ class NativeDecoderMixin:
             logger.info("[MVC INIT] Skipped: decoder already running")
             return
         self._mvc_restarting = True
-        print(f"[MVC INIT] V33j: Starting decoder (start_time={start_time})")
+        logger.info(f"[MVC INIT] V33j: Starting decoder (start_time={start_time})")
         if not MVC_SUPPORT_AVAILABLE or not NATIVE_RENDER_AVAILABLE:
             logger.warning("[MVC] Decoder start requested but MVC support is unavailable. Falling back to mpv.")
             self._mvc_restarting = False
@@ -297,7 +297,7 @@ class NativeDecoderMixin:
         # V7b FIX: Reset timeline trackers to ensure cursor movement
         self._last_mvc_timestamp = actual_start_time
         self._current_precise_time = actual_start_time
-        print(f"[SYNC] Decoder start position: {actual_start_time:.3f}s")
+        logger.info(f"[SYNC] Decoder start position: {actual_start_time:.3f}s")
 
         self._stop_mvc_decoder()
         if (getattr(self, '_mvc_shutdown_blocked', False)
@@ -310,7 +310,7 @@ class NativeDecoderMixin:
             self._fallback_to_mpv_mvc()
             return
 
-        print(f"[MVC INIT] Starting MVC decoder initialization")
+        logger.info("[MVC INIT] Starting MVC decoder initialization")
 
         # SSIF SEEK-FREEZE FIX: in MVC mode MPV is AUDIO-ONLY (video is decoded by the
         # demuxer+edge264). The global config gives MPV a 20s / 2 GB read-ahead — fine for
@@ -523,7 +523,7 @@ class NativeDecoderMixin:
 
             # CRITICAL: Let OpenGL initialize before starting decoding
             # Start the thread after a short delay to avoid race conditions
-            print(f"[MVC INIT] Starting decoder thread in 100ms...")
+            logger.info("[MVC INIT] Starting decoder thread in 100ms...")
             _session = self._media_session_id
             self._media_single_shot(
                 100,
@@ -549,7 +549,7 @@ class NativeDecoderMixin:
             # It is only shown when 3D mode is explicitly enabled via configure_3d_output.
             # The decoder output is directed to the embedded widget in 2D mode by default.
 
-            print(f"[MVC INIT] Framepacking window shown: visible={self.framepacking_window.isVisible()}")
+            logger.info(f"[MVC INIT] Framepacking window shown: visible={self.framepacking_window.isVisible()}")
 
             self.monitoring_overlay.update_window_state(self.framepacking_window.isVisible())
             self._framepacking_visible = self.framepacking_window.isVisible()
@@ -561,7 +561,7 @@ class NativeDecoderMixin:
             # V7c FIX: Hide loading overlay when MVC decoder is ready
             if hasattr(self, 'loading_overlay') and self.loading_overlay:
                 self.loading_overlay.hide_loading()
-                print("[MVC INIT] Loading overlay hidden")
+                logger.info("[MVC INIT] Loading overlay hidden")
 
             self.show_3d_notification("Initializing edge264 video...", success=True)
         except Exception:
@@ -6,6 +6,7 @@ import time
 from PySide6.QtCore import QTimer, Slot
 
 from sylc.robust_seek_queue import should_resume_after_sync
+from sylc.time_slider import shutdown_preview_mpv
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,7 @@ class PlaybackTimelineMixin:
         if snapped != target_time:
             logger.info(f"[THUMB] click snap: {target_time:.3f}s -> vignette IDR {snapped:.3f}s")
             target_time = snapped
-        print(f"[SEEK] Slider released at {target_time:.2f}s")
+        logger.info(f"[SEEK] Slider released at {target_time:.2f}s")
         
         # Use robust seek queue to prevent freezing/race conditions
         if hasattr(self, '_seek_queue'):
@@ -141,17 +142,17 @@ class PlaybackTimelineMixin:
                     self.player.pause = True
                     self.player.time_pos = time_pos
             except Exception as e:
-                print(f"[MVC] mpv seek failed: {e}")
+                logger.warning(f"[MVC] mpv seek failed: {e}")
 
             if self.mvc_decoder_thread and self.mvc_decoder_thread.isRunning():
-                print(f"[MVC] Requesting in-thread seek to {time_pos:.3f}s (fallback)")
+                logger.info(f"[MVC] Requesting in-thread seek to {time_pos:.3f}s (fallback)")
                 # V7b FIX: Prime audio clock to target to prevent false drift calc
                 self.mvc_decoder_thread.update_audio_clock(time_pos)
                 self.mvc_decoder_thread.seek(time_pos)
                 self._decoder_start_position = time_pos
                 self._sync_adjustment_count = 0
             else:
-                print(f"[MVC] Hard start at {time_pos:.3f}s (fallback)")
+                logger.info(f"[MVC] Hard start at {time_pos:.3f}s (fallback)")
                 self._start_mvc_decoder(start_time=time_pos)
 
             if self.player and self._was_playing_before_scrub:
@@ -185,7 +186,7 @@ class PlaybackTimelineMixin:
                     # Ensure internal tracker is updated for 2D mode as well
                     self._decoder_start_position = time_pos
             except Exception as e:
-                print(f"Error during seek: {e}")
+                logger.error(f"Error during seek: {e}")
             # HEVC path: seek the decode thread alongside the mpv audio seek.
             if getattr(self, '_hevc_mode_active', False) and getattr(self, 'hevc_thread', None):
                 try:
@@ -358,7 +359,7 @@ class PlaybackTimelineMixin:
         try:
             self.player.time_pos = target_time
         except Exception as e:
-            print(f"[SEEK-QUEUE] MPV seek failed: {e}")
+            logger.warning(f"[SEEK-QUEUE] MPV seek failed: {e}")
         # HEVC path uses the simple (is_mvc=False) seek route: drive the decode thread's
         # seek alongside the mpv audio seek. No IDR handshake — the thread re-anchors to
         # the mpv clock via clock_offset_provider.
@@ -398,7 +399,7 @@ class PlaybackTimelineMixin:
         self._last_timeline_update_time = time.monotonic()
 
         if self.mvc_decoder_thread and self.mvc_decoder_thread.isRunning():
-            print(f"[SEEK-QUEUE] Requesting decoder seek to {target_time:.3f}s")
+            logger.info(f"[SEEK-QUEUE] Requesting decoder seek to {target_time:.3f}s")
             # CRITICAL (SSIF/M2TS): the demuxer's proportional byte seek needs the media
             # duration. mpv has it by now (the slider works) even if the async observer
             # never propagated it, so push it right before seeking (the guaranteed point).
@@ -416,14 +417,14 @@ class PlaybackTimelineMixin:
             self._decoder_start_position = target_time
             self._sync_adjustment_count = 0
         elif self.mvc_mode_active:
-            print(f"[SEEK-QUEUE] Starting decoder at {target_time:.3f}s")
+            logger.info(f"[SEEK-QUEUE] Starting decoder at {target_time:.3f}s")
             self._start_mvc_decoder(start_time=target_time)
         else:
             # DF-FINAL FIX 2: mvc_mode_active is cleared by _fallback_from_edge264
             # (and _on_mvc_error before it). A decoder-seek queued before the
             # fallback must not resurrect the MVC pipeline after we've already
             # degraded to 2D mpv.
-            print(f"[SEEK-QUEUE] Ignoring stale decoder-start at {target_time:.3f}s "
+            logger.info(f"[SEEK-QUEUE] Ignoring stale decoder-start at {target_time:.3f}s "
                   f"(mvc_mode_active=False, pipeline fell back to 2D)")
 
     def update_ui_state(self):
@@ -541,6 +542,16 @@ class PlaybackTimelineMixin:
             # V8 CRASH FIX: Skip entirely during seek to reduce MPV contention
             if getattr(self, '_is_seeking', False):
                 return
+            # Throttle GUI-bound emissions to ~10 Hz. mpv pushes time-pos per
+            # decoded frame (24-60+ Hz) but the slider/label only needs coarse
+            # updates; delta-gating on the value itself self-corrects across
+            # seeks and loops (any large jump passes immediately). None always
+            # passes so the audio-only fallback in _handle_time_update fires.
+            if value is not None:
+                last = getattr(self, '_last_time_update', 0.0)
+                if abs(float(value) - last) < 0.1:
+                    return
+                self._last_time_update = float(value)
             self.mpv_time_event.emit((owner, source, value))
         except OSError:
             pass # Ignore access violations during shutdown
@@ -967,7 +978,7 @@ class PlaybackTimelineMixin:
         self._is_loading_file = False
         self._cancel_media_workers()
 
-        print("[PLAYER] Stopping playback...")
+        logger.info("[PLAYER] Stopping playback...")
         
         # VISUAL FIX: Hide windows IMMEDIATELY to prevent strobe of old frame
         if hasattr(self, 'framepacking_window') and self.framepacking_window:
@@ -1034,6 +1045,14 @@ class PlaybackTimelineMixin:
                 self._thumb_service.release_file()
             except Exception:
                 pass
+        # The legacy preview path's shared headless mpv is a reader too: it
+        # keeps the last-hovered file open across hovers, which would block
+        # the mid-session ISO dismount below (and leave the file "in use"
+        # after Stop). Terminate it here; the next hover recreates it lazily.
+        try:
+            shutdown_preview_mpv()
+        except Exception:
+            pass
         if getattr(self, '_active_iso_mount', None) or getattr(self, '_pending_iso_mount', None):
             self.current_file_path = None      # nothing is playing anymore
             if _released_async:
@@ -1,179 +1,11 @@
 # -*- coding: utf-8 -*-
 """Small reusable Qt widgets used by the SyLC player window."""
 
-from PySide6.QtCore import QPointF, QRectF, Qt, QTimer, Signal
+from PySide6.QtCore import QRectF, Qt, QTimer, Signal
 from PySide6.QtGui import (
-    QBrush, QColor, QFont, QFontMetrics, QPainter, QPainterPath, QPen,
+    QColor, QFont, QFontMetrics, QPainter, QPainterPath, QPen, QPixmap,
 )
-from PySide6.QtWidgets import QLabel, QPushButton, QWidget
-
-class PreviewTooltip(QLabel):
-    """Widget to display the frame preview."""
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowFlags(Qt.WindowType.ToolTip | Qt.WindowType.FramelessWindowHint)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setFixedSize(120, 68)  # 16:9 aspect ratio
-        self.setStyleSheet("""
-            QLabel {
-                background: #1a1a1a;
-                border: 2px solid #007ACC;
-                border-radius: 4px;
-            }
-        """)
-        self.setScaledContents(True)
-        self.hide()
-
-
-class IconButton(QPushButton):
-    """Professional HDR Converter style button - Modern Redesign."""
-
-    def __init__(self, icon_type, is_primary=False, parent=None):
-        super().__init__(parent)
-        self.icon_type = icon_type
-        self.is_primary = is_primary
-
-        if is_primary:
-            self.setFixedSize(48, 48)
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #007ACC, stop:1 #0063A3);
-                    border: 1px solid #0096FF;
-                    border-radius: 24px;
-                }
-                QPushButton:hover {
-                    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #0089E5, stop:1 #007ACC);
-                    border: 1px solid #33Aaff;
-                }
-                QPushButton:pressed {
-                    background-color: #004578;
-                    margin-top: 1px; 
-                }
-            """)
-        else:
-            self.setFixedSize(38, 38)
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(255, 255, 255, 0.05);
-                    border: 1px solid rgba(255, 255, 255, 0.1);
-                    border-radius: 6px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255, 255, 255, 0.12);
-                    border: 1px solid rgba(255, 255, 255, 0.2);
-                }
-                QPushButton:pressed {
-                    background-color: rgba(255, 255, 255, 0.15);
-                    margin-top: 1px;
-                }
-                QPushButton:checked {
-                    background-color: rgba(0, 122, 204, 0.3);
-                    border: 1px solid #007ACC;
-                }
-            """)
-
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-
-    def paintEvent(self, event):
-        super().paintEvent(event)
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Icon Color
-        color = QColor(240, 240, 240)
-        if not self.isEnabled():
-            color = QColor(255, 255, 255, 80)
-
-        # Thinner, more elegant stroke
-        pen = QPen(color, 1.5, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
-        painter.setPen(pen)
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-
-        center_x = self.width() / 2
-        center_y = self.height() / 2
-
-        if self.icon_type == 'play':
-            path = QPainterPath()
-            # Refined play triangle
-            path.moveTo(center_x - 3, center_y - 6)
-            path.lineTo(center_x + 5, center_y)
-            path.lineTo(center_x - 3, center_y + 6)
-            path.closeSubpath()
-            painter.fillPath(path, QBrush(color))
-
-        elif self.icon_type == 'pause':
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(QRectF(center_x - 6, center_y - 6, 4, 12), 1, 1)
-            painter.drawRoundedRect(QRectF(center_x + 2, center_y - 6, 4, 12), 1, 1)
-
-        elif self.icon_type == 'stop':
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(QRectF(center_x - 5, center_y - 5, 10, 10), 2, 2)
-
-        elif self.icon_type == 'folder':
-            path = QPainterPath()
-            path.moveTo(center_x - 8, center_y - 5)
-            path.lineTo(center_x - 3, center_y - 5)
-            path.lineTo(center_x - 1, center_y - 7)
-            path.lineTo(center_x + 8, center_y - 7)
-            path.lineTo(center_x + 8, center_y + 6)
-            path.lineTo(center_x - 8, center_y + 6)
-            path.closeSubpath()
-            painter.strokePath(path, pen)
-
-        elif self.icon_type == 'fullscreen':
-            gap = 6
-            len_ = 4
-            # TL
-            painter.drawLine(QPointF(center_x - gap, center_y - gap), QPointF(center_x - gap + len_, center_y - gap))
-            painter.drawLine(QPointF(center_x - gap, center_y - gap), QPointF(center_x - gap, center_y - gap + len_))
-            # TR
-            painter.drawLine(QPointF(center_x + gap, center_y - gap), QPointF(center_x + gap - len_, center_y - gap))
-            painter.drawLine(QPointF(center_x + gap, center_y - gap), QPointF(center_x + gap, center_y - gap + len_))
-            # BL
-            painter.drawLine(QPointF(center_x - gap, center_y + gap), QPointF(center_x - gap + len_, center_y + gap))
-            painter.drawLine(QPointF(center_x - gap, center_y + gap), QPointF(center_x - gap, center_y + gap - len_))
-            # BR
-            painter.drawLine(QPointF(center_x + gap, center_y + gap), QPointF(center_x + gap - len_, center_y + gap))
-            painter.drawLine(QPointF(center_x + gap, center_y + gap), QPointF(center_x + gap, center_y + gap - len_))
-
-        elif self.icon_type == 'exit_fullscreen':
-            gap = 7
-            len_ = 4
-            # TL (pointing in)
-            painter.drawLine(QPointF(center_x - gap + len_, center_y - gap + len_),
-                             QPointF(center_x - gap + len_, center_y - gap))
-            painter.drawLine(QPointF(center_x - gap + len_, center_y - gap + len_),
-                             QPointF(center_x - gap, center_y - gap + len_))
-            # BR (pointing in)
-            painter.drawLine(QPointF(center_x + gap - len_, center_y + gap - len_),
-                             QPointF(center_x + gap - len_, center_y + gap))
-            painter.drawLine(QPointF(center_x + gap - len_, center_y + gap - len_),
-                             QPointF(center_x + gap, center_y + gap - len_))
-
-        elif self.icon_type == '3d':
-            font = QFont('Segoe UI', 9, QFont.Weight.Bold)
-            painter.setFont(font)
-            painter.setPen(color)
-            painter.drawText(QRectF(0, 0, self.width(), self.height()), Qt.AlignmentFlag.AlignCenter, '3D')
-
-        elif self.icon_type == 'volume':
-            path = QPainterPath()
-            path.moveTo(center_x - 3, center_y - 2)
-            path.lineTo(center_x - 1, center_y - 2)
-            path.lineTo(center_x + 3, center_y - 5)
-            path.lineTo(center_x + 3, center_y + 5)
-            path.lineTo(center_x - 1, center_y + 2)
-            path.lineTo(center_x - 3, center_y + 2)
-            path.closeSubpath()
-            painter.fillPath(path, QBrush(color))
-            # Waves
-            painter.setPen(pen)
-            painter.drawArc(QRectF(center_x + 1, center_y - 3, 4, 6), -60 * 16, 120 * 16)
-            painter.drawArc(QRectF(center_x + 1, center_y - 6, 8, 12), -55 * 16, 110 * 16)
+from PySide6.QtWidgets import QWidget
 
 
 class LoadingOverlay(QWidget):
@@ -341,6 +173,10 @@ class InfoOverlay(QWidget):
     """Elegant welcome message in the center of the window - clickable to open a file."""
     file_clicked = Signal()
 
+    SUBTITLE = "MP4, MKV, AVI (3D & HDR)"
+    APP_TITLE = "SyLC Player"
+    EDITION = "3D Edition"
+
     def __init__(self, text, parent=None):
         super().__init__(parent)
 
@@ -349,12 +185,27 @@ class InfoOverlay(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
         self.text = text
+        # Fonts and strings never change, so shape each one through the font
+        # engine exactly once instead of per static-layer rebuild.
+        self._main_font = QFont('Segoe UI', 14, QFont.Weight.Normal)
+        self._main_w = QFontMetrics(self._main_font).horizontalAdvance(text)
+        self._sub_font = QFont('Segoe UI', 10, QFont.Weight.Normal)
+        self._sub_w = QFontMetrics(self._sub_font).horizontalAdvance(self.SUBTITLE)
+        self._title_font = QFont('Segoe UI', 24, QFont.Weight.Normal)
+        self._title_w = QFontMetrics(self._title_font).horizontalAdvance(self.APP_TITLE)
+        self._edition_font = QFont('Segoe UI', 9, QFont.Weight.Normal)
+        self._edition_w = QFontMetrics(self._edition_font).horizontalAdvance(self.EDITION)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self._pulse_timer = None  # Lazy initialization
         self._timer_initialized = False
         self._pulse_direction = -1
         self._pulse_value = 0.0
         self._hover = False
+        # Static layer (texts + folder outline) rasterized once per size; only
+        # the pulsing folder fill is repainted at animation rate.
+        self._static_cache = None
+        self._static_cache_key = None
+        self._folder_path = None
         self.setAcceptDrops(True)  # allow dropping a file onto the welcome area / icon too
 
     def _ensure_timer_initialized(self):
@@ -380,6 +231,10 @@ class InfoOverlay(QWidget):
         super().hideEvent(event)
 
     def _update_pulse(self):
+        # Belt and braces: hideEvent stops the timer, but a tick already
+        # queued when the overlay hides must not schedule a repaint.
+        if not self.isVisible():
+            return
         self._pulse_value += self._pulse_direction * 0.02
         if self._pulse_value <= 0.0:
             self._pulse_value = 0.0
@@ -393,12 +248,36 @@ class InfoOverlay(QWidget):
         self._ensure_timer_initialized()  # Lazy timer creation
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
 
+        dpr = self.devicePixelRatioF()
+        key = (self.size(), dpr)
+        if self._static_cache_key != key:
+            self._folder_path = self._build_folder_path()
+            cache = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            cache.setDevicePixelRatio(dpr)
+            cache.fill(Qt.GlobalColor.transparent)
+            static_painter = QPainter(cache)
+            static_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            static_painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            self._render_static(static_painter)
+            static_painter.end()
+            self._static_cache = cache
+            self._static_cache_key = key
+
+        # Fill the folder so its ENTIRE surface is clickable, not just the outline: a
+        # translucent (WA_TranslucentBackground) window only receives mouse input on painted
+        # pixels, so a hollow icon let clicks fall through its transparent interior. A gentle
+        # pulse (brighter on hover) also signals that it is clickable.
+        fill_alpha = 95 if self._hover else 42 + int(self._pulse_value * 26)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 122, 204, fill_alpha))
+        painter.drawPath(self._folder_path)
+
+        painter.drawPixmap(0, 0, self._static_cache)
+
+    def _build_folder_path(self):
         center_x = self.width() // 2
         center_y = self.height() // 2 - 40
-
-        icon_color = QColor(0, 122, 204, 200)
         path = QPainterPath()
         path.moveTo(center_x - 30, center_y - 12)
         path.lineTo(center_x - 10, center_y - 12)
@@ -407,48 +286,34 @@ class InfoOverlay(QWidget):
         path.lineTo(center_x + 30, center_y + 20)
         path.lineTo(center_x - 30, center_y + 20)
         path.closeSubpath()
-        # Fill the folder so its ENTIRE surface is clickable, not just the outline: a
-        # translucent (WA_TranslucentBackground) window only receives mouse input on painted
-        # pixels, so a hollow icon let clicks fall through its transparent interior. A gentle
-        # pulse (brighter on hover) also signals that it is clickable.
-        fill_alpha = 95 if self._hover else 42 + int(self._pulse_value * 26)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(0, 122, 204, fill_alpha))
-        painter.drawPath(path)
-        painter.strokePath(path, QPen(icon_color, 2, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap,
-                                      Qt.PenJoinStyle.RoundJoin))
+        return path
+
+    def _render_static(self, painter):
+        """Everything except the pulsing folder fill — cached until resize."""
+        center_x = self.width() // 2
+        center_y = self.height() // 2 - 40
+
+        icon_color = QColor(0, 122, 204, 200)
+        painter.strokePath(self._folder_path,
+                           QPen(icon_color, 2, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap,
+                                Qt.PenJoinStyle.RoundJoin))
 
         text_y = center_y + 60
-        font = QFont('Segoe UI', 14, QFont.Weight.Normal)
-        painter.setFont(font)
-        fm = QFontMetrics(font)
-        text_width = fm.horizontalAdvance(self.text)
+        painter.setFont(self._main_font)
         painter.setPen(QColor(224, 224, 224))
-        painter.drawText(int(center_x - text_width / 2), int(text_y), self.text)
+        painter.drawText(int(center_x - self._main_w / 2), int(text_y), self.text)
 
-        subtitle = "MP4, MKV, AVI (3D & HDR)"
-        subtitle_font = QFont('Segoe UI', 10, QFont.Weight.Normal)
-        painter.setFont(subtitle_font)
-        fm2 = QFontMetrics(subtitle_font)
-        subtitle_width = fm2.horizontalAdvance(subtitle)
+        painter.setFont(self._sub_font)
         painter.setPen(QColor(180, 180, 180))
-        painter.drawText(int(center_x - subtitle_width / 2), int(text_y + 26), subtitle)
+        painter.drawText(int(center_x - self._sub_w / 2), int(text_y + 26), self.SUBTITLE)
 
-        app_title = "SyLC Player"
-        title_font = QFont('Segoe UI', 24, QFont.Weight.Normal)
-        painter.setFont(title_font)
-        fm3 = QFontMetrics(title_font)
-        title_width = fm3.horizontalAdvance(app_title)
+        painter.setFont(self._title_font)
         painter.setPen(QColor(224, 224, 224))
-        painter.drawText(int(center_x - title_width / 2), 60, app_title)
+        painter.drawText(int(center_x - self._title_w / 2), 60, self.APP_TITLE)
 
-        edition = "3D Edition"
-        edition_font = QFont('Segoe UI', 9, QFont.Weight.Normal)
-        painter.setFont(edition_font)
-        fm4 = QFontMetrics(edition_font)
-        edition_width = fm4.horizontalAdvance(edition)
+        painter.setFont(self._edition_font)
         painter.setPen(QColor(0, 122, 204, 180))
-        painter.drawText(int(center_x - edition_width / 2), 78, edition)
+        painter.drawText(int(center_x - self._edition_w / 2), 78, self.EDITION)
 
     def enterEvent(self, event):
         self._hover = True
@@ -484,6 +349,6 @@ class InfoOverlay(QWidget):
 
 
 __all__ = [
-    'IconButton', 'InfoOverlay', 'LoadingOverlay', 'PreviewTooltip',
+    'InfoOverlay', 'LoadingOverlay',
 ]
 
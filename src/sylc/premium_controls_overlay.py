@@ -14,15 +14,17 @@ Features:
 """
 
 import os
-import subprocess
-import tempfile
 import shutil
 import logging
 import math
-from concurrent.futures import ThreadPoolExecutor
 import time
 
 from sylc.runtime_paths import RUNTIME_DIR
+from sylc.time_slider import (
+    _ATLAS_COLS, _ATLAS_TILE_H, _ATLAS_TILE_W, _cached_thumbnail,
+    _extract_thumbnail_atlas, _sweep_thumb_cache, _thumb_cache_path,
+    _thumbnail_executor as _extraction_executor,
+)
 
 logger = logging.getLogger(__name__)
 from PySide6.QtWidgets import (
@@ -30,11 +32,12 @@ from PySide6.QtWidgets import (
     QComboBox, QSizePolicy, QGraphicsDropShadowEffect, QFrame, QLayout, QMenu,
     QWidgetAction
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QRectF, QPointF, QPoint, QSize, QPropertyAnimation, QEasingCurve, Property, Slot
+from PySide6.QtCore import Qt, Signal, QTimer, QRectF, QPointF, QPoint, QLineF, QSize, QPropertyAnimation, QEasingCurve, Property, Slot
 from PySide6.QtGui import (
     QPainter, QColor, QFont, QFontMetrics, QPen, QBrush,
     QPainterPath, QLinearGradient, QRadialGradient, QConicalGradient, QPixmap,
-    QImage, QGuiApplication, QAction, QActionGroup, QIcon, QPolygonF
+    QImage, QGuiApplication, QAction, QActionGroup, QIcon, QPolygonF,
+    QStandardItemModel, QStandardItem
 )
 
 # (license/subscription system removed - freeware build)
@@ -72,63 +75,35 @@ def _resolve_external_tool(executable_name):
     return None
 
 
-_thumbnail_executor = ThreadPoolExecutor(max_workers=2)
-
-
-def _extract_thumbnail_ffmpeg(video_file, time_pos):
-    """Extract a thumbnail with ffmpeg (worker function)."""
-    try:
-        ffmpeg_path = _resolve_external_tool('ffmpeg')
-        if not ffmpeg_path:
-            return None
-
-        temp_file = os.path.join(tempfile.gettempdir(), f"preview_{int(time.time() * 1000000)}.jpg")
-
-        cmd = [
-            ffmpeg_path,
-            '-ss', str(time_pos),
-            '-i', video_file,
-            '-frames:v', '1',
-            '-vf', 'scale=320:-1',  # XL tooltip (320x180)
-            '-q:v', '5',
-            '-y',
-            temp_file
-        ]
-
-        creationflags = 0
-        if os.name == 'nt':
-            creationflags = 0x08000000  # CREATE_NO_WINDOW
-
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            timeout=2.0,
-            creationflags=creationflags
-        )
-
-        if result.returncode == 0 and os.path.exists(temp_file):
-            return temp_file
-        return None
-    except:
-        return None
-
-
 class PreviewTooltip(QWidget):
     """XL hover preview: 320x180 thumbnail + hh:mm:ss pill, screen-clamped.
 
     The tooltip follows the mouse on EVERY move (position + time pill update
-    immediately); only the image swaps asynchronously as thumbnails arrive."""
+    immediately); only the image swaps asynchronously as thumbnails arrive.
+
+    A top-level window is unavoidable — the preview floats over the native
+    mpv HWND, where a plain Qt child widget would be painted under the video
+    (the same airspace constraint that makes LoadingOverlay/InfoOverlay Tool
+    windows). But it is deliberately OPAQUE: WA_TranslucentBackground would
+    make it a layered window, and every move() of a layered window goes
+    through the compositor — a known slow path on multi-monitor setups, paid
+    here at mouse-move rate. An opaque frameless tooltip moves with a plain
+    SetWindowPos instead; paintEvent fills the full rect as a solid card."""
     THUMB_W, THUMB_H, PILL_H, GAP, PAD = 320, 180, 26, 6, 2
 
     def __init__(self, parent=None):
         super().__init__(parent, Qt.WindowType.ToolTip | Qt.WindowType.FramelessWindowHint)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         self.setFixedSize(self.THUMB_W + 2 * self.PAD,
                           self.THUMB_H + self.GAP + self.PILL_H + 2 * self.PAD)
         self._pixmap = None
         self._time_text = "00:00:00"
+        # Fixed-size widget: the rounded clip path for the thumbnail never
+        # changes, so build it once instead of per paint.
+        self._thumb_rect = QRectF(self.PAD, self.PAD, self.THUMB_W, self.THUMB_H)
+        self._thumb_clip = QPainterPath()
+        self._thumb_clip.addRoundedRect(self._thumb_rect, 8, 8)
         self.hide()
 
     def set_thumbnail(self, pixmap):
@@ -153,14 +128,14 @@ class PreviewTooltip(QWidget):
         if not p.isActive():
             return
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        thumb = QRectF(self.PAD, self.PAD, self.THUMB_W, self.THUMB_H)
+        # Opaque card (see class docstring): every pixel must be painted.
+        p.fillRect(self.rect(), PremiumColors.BG_DARK)
+        thumb = self._thumb_rect
         p.setPen(Qt.PenStyle.NoPen)
         p.setBrush(QBrush(QColor(16, 16, 20)))
         p.drawRoundedRect(thumb, 8, 8)
         if self._pixmap and not self._pixmap.isNull():
-            path = QPainterPath()
-            path.addRoundedRect(thumb, 8, 8)
-            p.setClipPath(path)
+            p.setClipPath(self._thumb_clip)
             p.drawPixmap(thumb.toRect(), self._pixmap)
             p.setClipping(False)
         p.setPen(QPen(PremiumColors.ACCENT_PRIMARY, 2))
@@ -184,10 +159,11 @@ class PreviewTooltip(QWidget):
         x = int(global_x) - self.width() // 2
         x = max(geo.left(), min(x, geo.right() - self.width()))
         y = max(geo.top(), int(global_y_top) - self.height() - 12)
-        self.move(x, y)
+        if self.pos() != QPoint(x, y):
+            self.move(x, y)
         if not self.isVisible():
             self.show()
-        self.raise_()
+            self.raise_()
 
 
 # =============================================================================
@@ -235,6 +211,17 @@ class PremiumIconButton(QPushButton):
     Button with premium vector icon and sophisticated hover effects.
     """
 
+    # Rasterized glyphs, shared app-wide. The background is animated (hover
+    # fade, glow pulse) and repaints at 60 FPS, but the icon on top only
+    # varies with (icon_type, size, color, device pixel ratio) — so the
+    # vector glyph is stroked once into a pixmap and each frame blits it.
+    _glyph_pixmaps = {}
+    _GLYPH_CACHE_CAP = 64
+
+    # Corner-bracket glyphs (fullscreen/exit_fullscreen) batched as QLineF
+    # tuples: one drawLines call instead of eight drawLine round-trips.
+    _glyph_lines = {}
+
     def __init__(self, icon_type, size='medium', parent=None):
         super().__init__(parent)
         self.icon_type = icon_type
@@ -387,10 +374,61 @@ class PremiumIconButton(QPushButton):
             if not self.isEnabled():
                 icon_color = QColor(255, 255, 255, 80)
 
-            self._draw_icon(painter, cx, cy, icon_color)
+            painter.drawPixmap(0, 0, self._glyph_pixmap(icon_color))
         except Exception:
             pass  # Ignore paint errors during seek/thread contention
 
+    def _glyph_pixmap(self, color):
+        """Serve the icon layer from the class-wide raster cache."""
+        dpr = self.devicePixelRatioF()
+        key = (self.icon_type, self.width(), self.height(), color.rgba(), dpr)
+        glyph = PremiumIconButton._glyph_pixmaps.get(key)
+        if glyph is None:
+            glyph = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            glyph.setDevicePixelRatio(dpr)
+            glyph.fill(Qt.GlobalColor.transparent)
+            p = QPainter(glyph)
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._draw_icon(p, self.width() / 2, self.height() / 2, color)
+            p.end()
+            if len(PremiumIconButton._glyph_pixmaps) >= PremiumIconButton._GLYPH_CACHE_CAP:
+                PremiumIconButton._glyph_pixmaps.pop(
+                    next(iter(PremiumIconButton._glyph_pixmaps)))
+            PremiumIconButton._glyph_pixmaps[key] = glyph
+        return glyph
+
+    def _shared_glyph_lines(self, cx, cy, s):
+        key = (self.icon_type, self.width(), self.height())
+        lines = PremiumIconButton._glyph_lines.get(key)
+        if lines is None:
+            lines = self._build_glyph_lines(cx, cy, s)
+            PremiumIconButton._glyph_lines[key] = lines
+        return lines
+
+    def _build_glyph_lines(self, cx, cy, s):
+        if self.icon_type == 'fullscreen':
+            corners = (
+                (cx - s * 0.4, cy - s * 0.4, 1, 1),  # TL
+                (cx + s * 0.4, cy - s * 0.4, -1, 1),  # TR
+                (cx - s * 0.4, cy + s * 0.4, 1, -1),  # BL
+                (cx + s * 0.4, cy + s * 0.4, -1, -1),  # BR
+            )
+        elif self.icon_type == 'exit_fullscreen':
+            offset = s * 0.15
+            corners = (
+                (cx - offset, cy - offset, -1, -1),
+                (cx + offset, cy - offset, 1, -1),
+                (cx - offset, cy + offset, -1, 1),
+                (cx + offset, cy + offset, 1, 1),
+            )
+        else:
+            return ()
+        lines = []
+        for x, y, dx, dy in corners:
+            lines.append(QLineF(x, y, x + dx * s * 0.25, y))
+            lines.append(QLineF(x, y, x, y + dy * s * 0.25))
+        return tuple(lines)
+
     def _draw_icon(self, painter, cx, cy, color):
         """Draws the vector icon."""
         painter.setPen(QPen(color, 2.0, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin))
@@ -434,34 +472,11 @@ class PremiumIconButton(QPushButton):
             path.closeSubpath()
             painter.strokePath(path, QPen(color, 1.8, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
 
-        elif self.icon_type == 'fullscreen':
+        elif self.icon_type in ('fullscreen', 'exit_fullscreen'):
             pen = QPen(color, 2)
             pen.setCapStyle(Qt.PenCapStyle.RoundCap)
             painter.setPen(pen)
-            corners = [
-                (cx - s * 0.4, cy - s * 0.4, 1, 1),  # TL
-                (cx + s * 0.4, cy - s * 0.4, -1, 1),  # TR
-                (cx - s * 0.4, cy + s * 0.4, 1, -1),  # BL
-                (cx + s * 0.4, cy + s * 0.4, -1, -1),  # BR
-            ]
-            for x, y, dx, dy in corners:
-                painter.drawLine(QPointF(x, y), QPointF(x + dx * s * 0.25, y))
-                painter.drawLine(QPointF(x, y), QPointF(x, y + dy * s * 0.25))
-
-        elif self.icon_type == 'exit_fullscreen':
-            pen = QPen(color, 2)
-            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            painter.setPen(pen)
-            offset = s * 0.15
-            corners = [
-                (cx - offset, cy - offset, -1, -1),
-                (cx + offset, cy - offset, 1, -1),
-                (cx - offset, cy + offset, -1, 1),
-                (cx + offset, cy + offset, 1, 1),
-            ]
-            for x, y, dx, dy in corners:
-                painter.drawLine(QPointF(x, y), QPointF(x + dx * s * 0.25, y))
-                painter.drawLine(QPointF(x, y), QPointF(x, y + dy * s * 0.25))
+            painter.drawLines(self._shared_glyph_lines(cx, cy, s))
 
         elif self.icon_type == 'volume':
             # Speaker cone
@@ -530,8 +545,7 @@ class PremiumIconButton(QPushButton):
             font = QFont('Segoe UI', int(s * 0.8), QFont.Weight.Bold)
             painter.setFont(font)
             painter.setPen(color)
-            painter.drawText(QRectF(0, 0, self.width(), self.height()),
-                             Qt.AlignmentFlag.AlignCenter, '3D')
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, '3D')
 
         elif self.icon_type == 'ai3d':
             # "AI" monogram with a stereo ghost: the same glyph echoed with a
@@ -539,7 +553,7 @@ class PremiumIconButton(QPushButton):
             # synthesis creates. Same typography as the '3d' glyph.
             font = QFont('Segoe UI', int(s * 0.8), QFont.Weight.Bold)
             painter.setFont(font)
-            rect = QRectF(0, 0, self.width(), self.height())
+            rect = QRectF(self.rect())
             ghost = QColor(color)
             ghost.setAlphaF(color.alphaF() * 0.35)
             painter.setPen(ghost)
@@ -787,10 +801,13 @@ class PremiumTimelineSlider(QSlider):
     Corrected version for consistent movement.
     """
 
-    preview_requested = Signal(float)
-    extraction_done = Signal(float, str)
+    extraction_done = Signal(float, bytes)
     scrub_finished = Signal(float)
 
+    # Atlas builds that fail get this many re-arms per file before the
+    # single-frame fallback carries the session alone.
+    _ATLAS_RETRY_CAP = 2
+
     def __init__(self, orientation=Qt.Orientation.Horizontal, parent=None):
         super().__init__(orientation, parent)
         self.setMouseTracking(True)
@@ -811,6 +828,12 @@ class PremiumTimelineSlider(QSlider):
         self._last_preview_time = -99
         self._preview_cache = {}
         self._displayed_exact = None    # (t_s, idr_s) of the exact vignette on screen
+        self._atlas = None         # sprite-sheet QPixmap (lazy-loaded, GUI thread)
+        self._atlas_path = None
+        self._atlas_count = 0
+        self._atlas_stride = 1.0
+        self._atlas_future = None
+        self._atlas_failures = 0   # per-file retry budget (see _kick_atlas_extraction)
         self._extraction_timer = QTimer(self)
         self._extraction_timer.setSingleShot(True)
         self._extraction_timer.timeout.connect(self._do_extraction)
@@ -824,6 +847,14 @@ class PremiumTimelineSlider(QSlider):
         self._anim_timer.timeout.connect(self._animate)
         self._anim_timer.setInterval(30)
 
+        # High-DPI mice deliver hundreds of move events per second; gate the
+        # hover repaint to ~60 Hz so input frequency never dictates paint
+        # frequency (setValue during scrubbing schedules its own repaint).
+        self._paint_gate = QTimer(self)
+        self._paint_gate.setInterval(16)
+        self._paint_gate.setSingleShot(True)
+        self._paint_gate.timeout.connect(self.update)
+
         # === CORRECTED SCRUBBING SYSTEM ===
         self._is_scrubbing = False
         self._scrub_start_value = 0
@@ -836,6 +867,16 @@ class PremiumTimelineSlider(QSlider):
         self.setFixedHeight(30) # Increased height to preventing clipping
         self.setStyleSheet("background: transparent;")
 
+        # paintEvent runs at scrub/hover rate; the colors never change, so
+        # build the static pens/brushes once instead of per repaint (the
+        # gradients stay per-paint — their geometry tracks progress/handle).
+        self._track_brush = QBrush(QColor(50, 55, 65))
+        self._buffer_brush = QBrush(QColor(80, 85, 95))
+        self._handle_shadow_brush = QBrush(QColor(0, 0, 0, 40))
+        self._handle_pen = QPen(PremiumColors.ACCENT_PRIMARY, 2)
+        self._hover_pen = QPen(QColor(255, 255, 255, 100), 1)
+        self._marker_brush = QBrush(PremiumColors.ACCENT_GLOW)
+
     def set_busy(self, busy):
         """Block or unblock user interaction."""
         self._is_busy = busy
@@ -874,8 +915,19 @@ class PremiumTimelineSlider(QSlider):
         ent = self._preview_cache.get(key)
         return bool(ent and ent[1])
 
-    def _nearest_cached(self, key, radius=30):
+    def _cache_lookup(self, key):
+        """Entry for key, refreshing its recency. Insertion order doubles as
+        the LRU order (eviction pops next(iter(...))), so a hit must move the
+        entry to the end — otherwise a vignette the user hovers constantly is
+        evicted as soon as 150 newer-INSERTED ones exist."""
         ent = self._preview_cache.get(key)
+        if ent is not None:
+            del self._preview_cache[key]
+            self._preview_cache[key] = ent
+        return ent
+
+    def _nearest_cached(self, key, radius=30):
+        ent = self._cache_lookup(key)
         if ent:
             return ent[0]
         best, best_d = None, radius + 1
@@ -940,10 +992,18 @@ class PremiumTimelineSlider(QSlider):
             self._video_file = norm_path
             self._preview_cache.clear()
             self._displayed_exact = None
+            self._atlas = None
+            self._atlas_path = None
+            self._atlas_future = None   # stale atlas results are dropped by the file guard
+            self._atlas_failures = 0
             # NO t=0 pre-warm extraction here: it raced the demuxer's open/probe
             # window (measured 2026-07-14, Avatar BD3D ISO: the concurrent ffmpeg
             # probe made the mounted UDF volume's reads return nothing → MVC init
             # aborted). Thumbnails are extracted on hover only.
+            # Keep the shared disk cache bounded; the sweep never touches
+            # entries for the current file unless they are genuinely the
+            # coldest ones.
+            _extraction_executor.submit(_sweep_thumb_cache)
 
         if duration and duration > 0:
             # Use milliseconds for better precision
@@ -1007,9 +1067,6 @@ class PremiumTimelineSlider(QSlider):
                 # Immediate emission during drag
                 self.sliderMoved.emit(self.value())
 
-            if not self._is_mvc_active:
-                self.preview_requested.emit(self._hover_time)
-
             # Tooltip follows the mouse IMMEDIATELY (position + time pill);
             # only the image updates asynchronously. GATED on _thumbs_allowed:
             # on optical-class sources (physical disc / mounted ISO) thumbnails
@@ -1019,7 +1076,7 @@ class PremiumTimelineSlider(QSlider):
                 gp = self.mapToGlobal(QPointF(pos, 0).toPoint())
                 self._preview_widget.set_time_text(self._fmt_time(self._hover_time))
                 key = round(self._hover_time)
-                ent = self._preview_cache.get(key)
+                ent = self._cache_lookup(key)
                 if ent is not None:
                     self._preview_widget.set_thumbnail(ent[0])
                     # WYSIWYG identity: remember which exact vignette is on screen
@@ -1050,7 +1107,8 @@ class PremiumTimelineSlider(QSlider):
                 else:
                     self._request_on_demand_preview(self._hover_time, pos)
 
-        self.update()
+        if not self._paint_gate.isActive():
+            self._paint_gate.start()
         if self._is_scrubbing:
             # OWN THE GESTURE (see mousePressEvent): QSlider's drag would rewrite
             # the value with its full-width mapping on every move.
@@ -1140,48 +1198,127 @@ class PremiumTimelineSlider(QSlider):
             self.scrub_finished.emit(target_s)
             self._pending_scrub_value = None
 
-    # --- Legacy ffmpeg preview path (non-H.264 sources only) ---
+    # --- Legacy preview path (non-H.264 sources only): the shared
+    # --- time_slider pipeline — per-file disk cache, headless-mpv grab,
+    # --- ffmpeg fallback — on the shared extraction executor. ---
     def _request_on_demand_preview(self, time_pos, mouse_x):
-        if round(time_pos) in self._preview_cache:
+        if self._cache_lookup(round(time_pos)) is not None:
             return   # already displayed by the hover handler
+        # Atlas warmed up: O(1) crop from the sprite sheet — an 'approx'
+        # cache entry (mid-GOP sample), so it bridges the wait but never
+        # suppresses the exact single-frame request below.
+        pm = self._atlas_tile(time_pos)
+        if pm is not None:
+            self._insert_cache(round(time_pos), pm, exact=False)
+            if self._hover_pos >= 0 and not self._has_exact(round(self._hover_time)):
+                self._preview_widget.set_thumbnail(pm)
+                self._displayed_exact = None
+        self._kick_atlas_extraction()   # lazy, once per file, on first hover
         self._pending_time = time_pos
         self._pending_mouse_x = mouse_x
         self._extraction_timer.start(150)
 
+    def _kick_atlas_extraction(self):
+        """Submit the one-shot sprite-sheet build on first hover."""
+        if self._atlas_future is not None or not self._video_file or self.maximum() <= 0:
+            return
+        video_file = self._video_file
+        future = _extraction_executor.submit(
+            _extract_thumbnail_atlas, video_file, self.maximum() / 1000.0)
+        self._atlas_future = future
+
+        def _store(f, video_file=video_file):
+            try:
+                res = f.result()
+            except Exception:
+                res = None
+            if video_file != self._video_file:
+                return
+            if res:
+                # Only the path crosses the thread boundary; the QPixmap is
+                # created on the GUI thread at first lookup.
+                self._atlas_path, self._atlas_count, self._atlas_stride = res
+            else:
+                # Transient failure (file still being written, ffmpeg busy):
+                # clear the one-shot latch so a later hover retries — but at
+                # most _ATLAS_RETRY_CAP times per file. The atlas pass decodes
+                # the whole file; a title that cannot finish inside the ffmpeg
+                # timeout would otherwise resubmit a fresh full-decode on
+                # every hover, pinning one of the executor's two workers for
+                # the rest of the session.
+                self._atlas_failures += 1
+                if self._atlas_failures <= self._ATLAS_RETRY_CAP:
+                    self._atlas_future = None
+        future.add_done_callback(_store)
+
+    def _atlas_tile(self, time_pos):
+        """Crop the 120x68 tile covering time_pos out of the sprite sheet.
+        Returns None while the atlas is not (yet) available."""
+        if self._atlas is None:
+            if not self._atlas_path:
+                return None
+            atlas = QPixmap(self._atlas_path)
+            if atlas.isNull():
+                self._atlas_path = None     # unreadable: fall back for good
+                return None
+            self._atlas = atlas
+        idx = min(self._atlas_count - 1,
+                  max(0, int(time_pos / self._atlas_stride)))
+        row, col = divmod(idx, _ATLAS_COLS)
+        tile = self._atlas.copy(
+            col * _ATLAS_TILE_W, row * _ATLAS_TILE_H, _ATLAS_TILE_W, _ATLAS_TILE_H)
+        return tile if not tile.isNull() else None
+
     def _do_extraction(self):
         # Extraction runs during MVC playback too: the old V13 blanket ban
         # (0xe24c4a02) predates the targeted ctypes/mpv guards, and this path
-        # only spawns ffmpeg out-of-process — it touches no decoder/mpv state.
+        # uses a dedicated headless libmpv instance (own handle, own event
+        # thread) with an out-of-process ffmpeg fallback — it touches no
+        # state of the PLAYER's decoder or mpv core.
         # Physical optical sources stay excluded via set_thumbnails_allowed
         # (third reader on the single optical head = measured 45-120s thrash).
         if not self._thumbs_allowed or not self._video_file:
             return
 
         time_pos = self._pending_time
-        mouse_x = self._pending_mouse_x
-        future = _thumbnail_executor.submit(_extract_thumbnail_ffmpeg, self._video_file, time_pos)
+        # Warm disk cache: skip the executor round-trip and display synchronously
+        # (one small file read, not a subprocess launch).
+        cache_path = _thumb_cache_path(self._video_file, time_pos)
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as fh:
+                    self.extraction_done.emit(time_pos, fh.read())
+                return
+            except OSError:
+                pass
+        future = _extraction_executor.submit(
+            _cached_thumbnail, self._video_file, time_pos)
         future.add_done_callback(lambda f: self._handle_extraction_result(f, time_pos))
 
     def _handle_extraction_result(self, future, time_pos):
         try:
-            temp_file = future.result()
-            if temp_file:
-                self.extraction_done.emit(time_pos, temp_file)
+            data = future.result()
+            if data:
+                self.extraction_done.emit(time_pos, data)
         except:
             pass
 
-    @Slot(float, str)
-    def _on_extraction_done(self, time_pos, temp_file):
+    @Slot(float, bytes)
+    def _on_extraction_done(self, time_pos, data):
         try:
-            pixmap = QPixmap(temp_file)
-            if not pixmap.isNull():
-                self._insert_cache(round(time_pos), pixmap)
-                if self._hover_pos >= 0 and abs(time_pos - self._hover_time) <= 2.0:
-                    self._preview_widget.set_thumbnail(pixmap)
-            try:
-                os.remove(temp_file)
-            except:
-                pass
+            pixmap = QPixmap()
+            pixmap.loadFromData(data, 'JPG')
+            if not pixmap.isNull() and pixmap.width() > 480:
+                # mpv screenshots come back full-resolution; the tooltip blits
+                # a 320px rect and the cache holds up to 150 entries.
+                pixmap = pixmap.scaledToWidth(
+                    PreviewTooltip.THUMB_W,
+                    Qt.TransformationMode.SmoothTransformation)
+            if pixmap.isNull():
+                return
+            self._insert_cache(round(time_pos), pixmap)
+            if self._hover_pos >= 0 and abs(time_pos - self._hover_time) <= 2.0:
+                self._preview_widget.set_thumbnail(pixmap)
         except Exception:
             pass
 
@@ -1200,14 +1337,14 @@ class PremiumTimelineSlider(QSlider):
 
             # === TRACK BACKGROUND ===
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(QColor(50, 55, 65)))
+            painter.setBrush(self._track_brush)
             painter.drawRoundedRect(track_rect, track_height / 2, track_height / 2)
 
             # === BUFFER INDICATOR ===
             if self._buffer_progress > 0:
                 buffer_width = track_rect.width() * self._buffer_progress
                 buffer_rect = QRectF(track_rect.x(), track_rect.y(), buffer_width, track_rect.height())
-                painter.setBrush(QBrush(QColor(80, 85, 95)))
+                painter.setBrush(self._buffer_brush)
                 painter.drawRoundedRect(buffer_rect, track_height / 2, track_height / 2)
 
             # === PROGRESS BAR ===
@@ -1239,7 +1376,7 @@ class PremiumTimelineSlider(QSlider):
                 handle_radius = 8 if self._hover_pos >= 0 else 6
 
                 # Handle shadow
-                painter.setBrush(QBrush(QColor(0, 0, 0, 40)))
+                painter.setBrush(self._handle_shadow_brush)
                 painter.drawEllipse(QPointF(handle_x, track_y + track_height / 2 + 1), handle_radius, handle_radius)
 
                 # Handle
@@ -1247,18 +1384,18 @@ class PremiumTimelineSlider(QSlider):
                 gradient.setColorAt(0, QColor(255, 255, 255))
                 gradient.setColorAt(1, QColor(220, 225, 235))
                 painter.setBrush(QBrush(gradient))
-                painter.setPen(QPen(PremiumColors.ACCENT_PRIMARY, 2))
+                painter.setPen(self._handle_pen)
                 painter.drawEllipse(QPointF(handle_x, track_y + track_height / 2), handle_radius, handle_radius)
 
             # === HOVER INDICATOR ===
             if self._hover_pos >= 0 and self.maximum() > 0:
-                painter.setPen(QPen(QColor(255, 255, 255, 100), 1))
+                painter.setPen(self._hover_pen)
                 painter.drawLine(QPointF(self._hover_pos, 0), QPointF(self._hover_pos, self.height()))
 
             # === PREVIEW MARKER ===
             if self._hover_pos >= 0 and self.maximum() > 0:
                 # Draw a small dot on the track at the hover position
-                painter.setBrush(QBrush(PremiumColors.ACCENT_GLOW))
+                painter.setBrush(self._marker_brush)
                 painter.setPen(Qt.PenStyle.NoPen)
                 painter.drawEllipse(QPointF(self._hover_pos, track_y + track_height / 2), 3, 3)
         except Exception:
@@ -1445,6 +1582,11 @@ class PremiumSpectrumMeter(QWidget):
         self.setToolTip("Live audio level")
         n = self.BANDS
         self._h = [0.0] * n          # smoothed bar heights 0..1
+        self._geom_key = None        # (w, h, n) the cached band geometry fits
+        self._band_tracks = []
+        self._band_clips = []
+        self._band_rad = 0.0
+        self._band_grad = None
         self._level = 0.0            # latest overall level 0..1
         self._peak = 0.0             # latest transient peak 0..1
         self._phase = 0.0
@@ -1511,31 +1653,52 @@ class PremiumSpectrumMeter(QWidget):
         n = max(5, min(self.BANDS, int(available / 5.0)))
         top, bot = 6.0, h - 6.0
         span = bot - top
-        gap = 2.0
-        bar_w = max(1.5, (available - gap * (n + 1)) / n)
-        rad = min(2.0, bar_w / 2.0)
-        grad = QLinearGradient(0, top, 0, bot)
-        grad.setColorAt(0.0, QColor(150, 233, 255))
-        grad.setColorAt(0.4, QColor(40, 196, 255))
-        grad.setColorAt(1.0, QColor(8, 90, 130))
-        x = gap
+
+        # Band geometry (rects, clip paths, gradient) only depends on the
+        # widget size; the poll-rate repaint just re-reads levels. Rebuilding
+        # a QPainterPath per lit band per frame was the hottest allocation in
+        # this paint.
+        if self._geom_key != (w, h, n):
+            gap = 2.0
+            bar_w = max(1.5, (available - gap * (n + 1)) / n)
+            rad = min(2.0, bar_w / 2.0)
+            grad = QLinearGradient(0, top, 0, bot)
+            grad.setColorAt(0.0, QColor(150, 233, 255))
+            grad.setColorAt(0.4, QColor(40, 196, 255))
+            grad.setColorAt(1.0, QColor(8, 90, 130))
+            tracks = []
+            clips = []
+            x = gap
+            for _ in range(n):
+                rect = QRectF(x, top, bar_w, span)
+                clip = QPainterPath()
+                clip.addRoundedRect(rect, rad, rad)
+                tracks.append(rect)
+                clips.append(clip)
+                x += bar_w + gap
+            self._band_tracks = tracks
+            self._band_clips = clips
+            self._band_rad = rad
+            self._band_grad = grad
+            self._geom_key = (w, h, n)
+
+        grad = self._band_grad
+        rad = self._band_rad
         for draw_index in range(n):
             i = int(round(draw_index * (self.BANDS - 1) / max(1, n - 1)))
+            rect = self._band_tracks[draw_index]
             # unlit track
             p.setPen(Qt.PenStyle.NoPen)
             p.setBrush(QColor(255, 255, 255, 12))
-            p.drawRoundedRect(QRectF(x, top, bar_w, span), rad, rad)
+            p.drawRoundedRect(rect, rad, rad)
             v = self._h[i]
             if v > 0.003:
                 lit_top = bot - v * span
                 p.save()
-                clip = QPainterPath()
-                clip.addRoundedRect(QRectF(x, top, bar_w, span), rad, rad)
-                p.setClipPath(clip)
+                p.setClipPath(self._band_clips[draw_index])
                 p.setBrush(QBrush(grad))
-                p.drawRect(QRectF(x, lit_top, bar_w, bot - lit_top))
+                p.drawRect(QRectF(rect.x(), lit_top, rect.width(), bot - lit_top))
                 p.restore()
-            x += bar_w + gap
 
 
 class PremiumControlsOverlay(QWidget):
@@ -1589,13 +1752,16 @@ class PremiumControlsOverlay(QWidget):
     audio_track_changed = Signal(int)
     subtitle_track_changed = Signal(int)
 
-    # Items offered by the stereo-mode combo (display labels only — the
-    # internal mode keys are unaffected, see stereo_mode_combo below).
-    # "Glasses (F-SBS)" is an OUTPUT layout like MultiView and Dual Projector,
-    # not a source format: it emits Full Side-by-Side 3840x1080 whatever the
-    # input was. Named for what the user plugs in, not for the pixel layout.
-    STEREO_COMBO_ITEMS = ("MultiView", "Side-by-Side", "Top-Bottom",
-                          "Dual Projector", "Glasses (F-SBS)")
+    # Items offered by the stereo-mode combo: (display label, internal key).
+    # The keys ride along as QComboBox userData so no label→key dict is needed
+    # anywhere. "Glasses (F-SBS)" is an OUTPUT layout like MultiView and Dual
+    # Projector, not a source format: it emits Full Side-by-Side 3840x1080
+    # whatever the input was. Named for what the user plugs in, not for the
+    # pixel layout.
+    STEREO_COMBO_ENTRIES = (("MultiView", "mvc"), ("Side-by-Side", "sbs"),
+                            ("Top-Bottom", "tab"), ("Dual Projector", "dual"),
+                            ("Glasses (F-SBS)", "glasses"))
+    STEREO_COMBO_ITEMS = tuple(label for label, _key in STEREO_COMBO_ENTRIES)
     METER_STANDARD_LAYOUT_WIDTH = 1180
 
     def __init__(self, parent=None):
@@ -1611,6 +1777,16 @@ class PremiumControlsOverlay(QWidget):
         # cannot steal the foreground by merely becoming visible.
         self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating, True)
 
+        self._bg_cache = None       # rasterized glassmorphism background
+        self._bg_cache_key = None   # (size, device pixel ratio) it was built for
+
+        # One-slot timecode memo: mpv's time-pos observer can fire many times
+        # per second while the label text only changes once per second.
+        self._last_time_int = -1
+        self._last_time_str = "00:00"
+        self._time_label_text = None      # last string pushed to time_label
+        self._duration_label_text = None  # last string pushed to duration_label
+
         self._setup_ui()
         self._connect_signals()
 
@@ -1754,9 +1930,10 @@ class PremiumControlsOverlay(QWidget):
         # Stereo mode combo
         self.stereo_mode_combo = QComboBox()
         self.stereo_mode_combo.setObjectName("stereoModeCombo")
-        # Display label "MultiView"; the internal key stays 'mvc' (mode_map below) — dozens
+        # Display label "MultiView"; the internal key stays 'mvc' (userData) — dozens
         # of consumers depend on the 'mvc' string, only the user-visible text changes.
-        self.stereo_mode_combo.addItems(list(self.STEREO_COMBO_ITEMS))
+        for label, key in self.STEREO_COMBO_ENTRIES:
+            self.stereo_mode_combo.addItem(label, key)
         # Widened from a hardcoded 140 (which truncated "MultiView" to "MultiVi") to a
         # font-metrics-derived floor covering the longest item, so no item is ever clipped.
         combo_min_width = max(140, self._compute_stereo_combo_width())
@@ -2244,7 +2421,8 @@ class PremiumControlsOverlay(QWidget):
 
         self.iso_action = QAction("Create a disc ISO image", menu)
         self.iso_action.setIcon(self._export_menu_icon('disc'))
-        self.iso_action.triggered.connect(lambda: self.archive_requested.emit())
+        # Signal-to-signal: Qt drops triggered's bool, no lambda frame needed.
+        self.iso_action.triggered.connect(self.archive_requested)
         self.iso_action.setStatusTip("Create a lossless ISO backup of the inserted disc.")
         menu.addAction(self.iso_action)
 
@@ -2728,13 +2906,13 @@ class PremiumControlsOverlay(QWidget):
         # « Sauvegarde / Export » QMenu (setMenu, wired in _build_export_menu); the
         # ISO entry is what emits archive_requested now.
         self.volume_slider.volume_changed.connect(self.volume_changed)
-        self.time_slider.sliderMoved.connect(lambda pos: self._on_slider_scrub(pos))
+        self.time_slider.sliderMoved.connect(self._on_slider_scrub)
         # ANTI-SPAM: Use scrub_finished (debounced) instead of sliderReleased
         self.time_slider.scrub_finished.connect(self._emit_seek)
         # Keep sliderReleased as a backup for simple clicks
         self.time_slider.sliderReleased.connect(self._on_slider_released)
         self.mode_3d_button.toggled.connect(self.mode_3d_toggled)
-        self.stereo_mode_combo.currentTextChanged.connect(self._on_stereo_mode_changed)
+        self.stereo_mode_combo.currentIndexChanged.connect(self._on_stereo_mode_changed)
         self.audio_track_combo.currentIndexChanged.connect(self._on_audio_track_changed)
         self.subtitle_track_combo.currentIndexChanged.connect(self._on_subtitle_track_changed)
 
@@ -2827,34 +3005,54 @@ class PremiumControlsOverlay(QWidget):
         if self.time_slider.maximum() != new_max:
             self.time_slider.setRange(0, new_max)
         self.time_slider.setEnabled(seconds > 0)
-        self.duration_label.setText(self._format_time(seconds))
+        text = self._format_time(seconds)
+        if text != self._duration_label_text:
+            self._duration_label_text = text
+            self.duration_label.setText(text)
 
     def set_time(self, seconds):
         """Updates the current position."""
         if seconds is not None and not self.time_slider.isSliderDown():
             self.time_slider.setValue(int(seconds * 1000))
-        self.time_label.setText(self._format_time(seconds))
+        text = self._format_time(seconds)
+        if text != self._time_label_text:
+            self._time_label_text = text
+            self.time_label.setText(text)
 
     def set_buffer_progress(self, progress):
         """Updates the buffer indicator (0-1)."""
         self.time_slider.set_buffer_progress(progress)
 
     def update_audio_tracks(self, tracks):
-        """Updates the audio track list."""
+        """Updates the audio track list.
+
+        Rows are appended to the model in one block instead of per-item
+        addItem calls, so the combo's view sees a single insertion instead
+        of N resets on track-heavy files. The model is created once and
+        cleared on refresh; itemData() keeps reading track ids from
+        Qt.UserRole exactly as with addItem(label, track_id).
+        """
+        model = getattr(self, '_audio_track_model', None)
+        if model is None:
+            model = self._audio_track_model = QStandardItemModel(self.audio_track_combo)
+            self.audio_track_combo.setModel(model)
         self.audio_track_combo.blockSignals(True)
-        self.audio_track_combo.clear()
+        model.clear()
         if not tracks:
-            self.audio_track_combo.addItem("No tracks")
+            model.appendRow(QStandardItem("No tracks"))
             self.audio_track_combo.setEnabled(False)
         else:
-            self.audio_track_combo.addItem("Select...")
+            items = [QStandardItem("Select...")]
             for track_id, title, lang in tracks:
                 # Compact but readable format
                 if lang:
                     label = f"{title} [{lang.upper()}]"
                 else:
                     label = title
-                self.audio_track_combo.addItem(label, track_id)
+                item = QStandardItem(label)
+                item.setData(track_id, Qt.ItemDataRole.UserRole)
+                items.append(item)
+            model.invisibleRootItem().appendRows(items)
             self.audio_track_combo.setEnabled(True)
             self.audio_track_combo.setCurrentIndex(1)
         self.audio_track_combo.blockSignals(False)
@@ -2934,12 +3132,15 @@ class PremiumControlsOverlay(QWidget):
     def _format_time(self, seconds):
         if seconds is None:
             return "00:00"
-        s = int(seconds)
-        h, s = divmod(s, 3600)
+        total = int(seconds)
+        if total == self._last_time_int:
+            return self._last_time_str
+        h, s = divmod(total, 3600)
         m, s = divmod(s, 60)
-        if h > 0:
-            return f"{h}:{m:02}:{s:02}"
-        return f"{m:02}:{s:02}"
+        text = f"{h}:{m:02}:{s:02}" if h > 0 else f"{m:02}:{s:02}"
+        self._last_time_int = total
+        self._last_time_str = text
+        return text
 
     def _emit_seek(self, value=None):
         """Emits seeked signal with value in seconds."""
@@ -2960,15 +3161,15 @@ class PremiumControlsOverlay(QWidget):
         pass
 
     def _on_slider_scrub(self, pos):
-        self.time_label.setText(self._format_time(pos / 1000.0))
+        text = self._format_time(pos / 1000.0)
+        if text != self._time_label_text:
+            self._time_label_text = text
+            self.time_label.setText(text)
 
-    def _on_stereo_mode_changed(self, text):
-        # "MultiView" is the display label for the internal 'mvc' key (unchanged everywhere
-        # internal). "MVC" kept as an alias for robustness against older callers.
-        mode_map = {"MultiView": "mvc", "MVC": "mvc",
-                    "Side-by-Side": "sbs", "Top-Bottom": "tab",
-                    "Dual Projector": "dual", "Glasses (F-SBS)": "glasses"}
-        self.stereo_mode_changed.emit(mode_map.get(text, "auto"))
+    def _on_stereo_mode_changed(self, _index):
+        # The internal key travels as the item's userData (STEREO_COMBO_ENTRIES),
+        # so there is no display-label dict to rebuild or keep in sync.
+        self.stereo_mode_changed.emit(self.stereo_mode_combo.currentData() or "auto")
 
     def _on_audio_track_changed(self, index):
         if index > 0:
@@ -2988,13 +3189,39 @@ class PremiumControlsOverlay(QWidget):
     # === PAINT ===
 
     def paintEvent(self, event):
-        """Draws glassmorphism background."""
+        """Draws glassmorphism background (cached; identical until a resize)."""
         try:
+            # Qt can deliver paints in transitional hidden/occluded states
+            # (mode toggles, fades); nothing to rasterize then.
+            if not self.isVisible() or event.region().isEmpty():
+                return
             painter = QPainter(self)
             if not painter.isActive():
                 return
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            # Partial updates (e.g. a child tooltip repaint) only need the
+            # dirty region re-blitted.
+            painter.setClipRegion(event.region())
+            # The gradients/border/glow are pure functions of the size, yet
+            # they were re-rendered on every paint while the bar is visible.
+            # Rasterize once per size and blit.
+            dpr = self.devicePixelRatioF()
+            key = (self.size(), dpr)
+            if self._bg_cache_key != key:
+                cache = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+                cache.setDevicePixelRatio(dpr)
+                cache.fill(Qt.GlobalColor.transparent)
+                bg_painter = QPainter(cache)
+                bg_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                self._render_background(bg_painter)
+                bg_painter.end()
+                self._bg_cache = cache
+                self._bg_cache_key = key
+            painter.drawPixmap(0, 0, self._bg_cache)
+        except Exception:
+            pass  # Ignore paint errors
 
+    def _render_background(self, painter):
+        try:
             rect = QRectF(0, 0, self.width(), self.height())
 
             # Background with glassmorphism effect
@@ -3035,6 +3262,7 @@ class PremiumControlsOverlay(QWidget):
             pass  # Ignore paint errors
 
 
+
 # =============================================================================
 # COMPATIBILITY WRAPPER
 # =============================================================================
@@ -34,14 +34,52 @@ class SubtitleTrackMixin:
             _rem = getattr(self, '_remember_for_file', None)
             if _rem is not None:
                 _rem(audio_track=int(track_id))
-            print(f"Audio track changed: ID {track_id}")
+            logger.info(f"Audio track changed: ID {track_id}")
         except (OSError, RuntimeError, Exception) as e:
-            print(f"Error changing audio track: {e}")
+            logger.error(f"Error changing audio track: {e}")
 
-    def load_audio_tracks(self, session_id=None):
-        if not self.has_media: return
+    def on_track_list_change(self, _, value, session_id=None, core=None):
+        """mpv-thread callback: marshal track enumeration onto Qt's main thread."""
         owner = self._media_session_id if session_id is None else session_id
-        self._media_single_shot(500, lambda: self._fetch_audio_tracks(owner), owner)
+        source = self.player if core is None else core
+        self.mpv_track_list_event.emit((owner, source, value))
+
+    @Slot(object)
+    def _dispatch_mpv_track_list(self, payload):
+        """Populate the track combos once mpv has actually enumerated tracks.
+
+        Replaces the old fixed 500 ms post-load timers: the observer fires the
+        moment track-list becomes non-empty, so enumeration no longer waits out
+        an arbitrary delay (and no longer races it on slow volumes). mpv grows
+        the list entry by entry while opening the file, so a short quiet period
+        is debounced instead of rebuilding the combos once per added track.
+        """
+        session_id, core, value = payload
+        if not self._session_is_current(session_id, core=core):
+            return
+        if getattr(self, '_mpv_transition_in_progress', False):
+            return
+        if not value or not self.has_media:
+            return
+        if getattr(self, '_track_list_fetched_session', None) == session_id:
+            return
+        rev = getattr(self, '_track_list_rev', 0) + 1
+        self._track_list_rev = rev
+        # The observer already delivered the fully-parsed list; keep the latest
+        # snapshot so the fetchers don't marshal the whole property again.
+        self._track_list_snapshot = value
+
+        def _enumerate():
+            if self._track_list_rev != rev:
+                return  # superseded by a later track-list event
+            if getattr(self, '_track_list_fetched_session', None) == session_id:
+                return
+            self._track_list_fetched_session = session_id
+            snapshot = self._track_list_snapshot
+            self._fetch_audio_tracks(session_id, track_list=snapshot)
+            self._fetch_subtitle_tracks(session_id, track_list=snapshot)
+
+        self._media_single_shot(250, _enumerate, session_id)
 
     def _get_clpi_lang_map(self):
         """Return {PID: 'iso639'} from the Blu-ray .clpi for the current file (cached).
@@ -62,13 +100,14 @@ class SubtitleTrackMixin:
             logger.info(f"[CLPI] Loaded {len(self._clpi_lang_map)} stream languages from {os.path.basename(clpi)}")
         return self._clpi_lang_map
 
-    def _fetch_audio_tracks(self, session_id=None):
+    def _fetch_audio_tracks(self, session_id=None, track_list=None):
         owner = self._media_session_id if session_id is None else session_id
         if not self._session_is_current(owner):
             return
         try:
             if not self.player: return
-            track_list = self.player.track_list
+            if track_list is None:
+                track_list = self.player.track_list
             lang_map = self._get_clpi_lang_map()
             audio_tracks = []
             for track in track_list:
@@ -76,7 +115,7 @@ class SubtitleTrackMixin:
                     track_id = track.get('id')
                     label = _friendly_track_label(track, 'audio', lang_map)
                     audio_tracks.append((track_id, label, ''))  # label is already complete
-            print(f"Audio tracks found: {len(audio_tracks)}")
+            logger.info(f"Audio tracks found: {len(audio_tracks)}")
             # In the native modes mpv exists ONLY to play the audio. With no
             # audio track it has literally nothing to do (vid=no) and its
             # spontaneous pause/EOF reports are noise — flag it so
@@ -101,7 +140,7 @@ class SubtitleTrackMixin:
             if aid is not None:
                 self.change_audio_track(aid)
         except Exception as e:
-            print(f"Error fetching audio tracks: {e}")
+            logger.error(f"Error fetching audio tracks: {e}")
 
     def _disable_all_subtitle_outputs(self):
         """Make the UI's ``None`` state true in every subtitle backend.
@@ -364,7 +403,7 @@ class SubtitleTrackMixin:
                         self._disable_text_subtitles()
                     logger.info(f"[SUBTITLE] track changed: ID {track_id}")
             except Exception as e:
-                print(f"Error changing subtitle track: {e}")
+                logger.error(f"Error changing subtitle track: {e}")
 
     def _load_pgs_subtitle_track(self, pgs_track):
         """Load a PGS subtitle track for MVC overlay rendering (async)."""
@@ -772,14 +811,7 @@ class SubtitleTrackMixin:
         except Exception as e:
             logger.error(f"[TEXT-SUBS] Error connecting text renderer: {e}")
 
-    def load_subtitle_tracks(self, session_id=None):
-        logger.info(f"[SUBTITLE] load_subtitle_tracks called, has_media={self.has_media}")
-        if not self.has_media: return
-        owner = self._media_session_id if session_id is None else session_id
-        self._media_single_shot(
-            500, lambda: self._fetch_subtitle_tracks(owner), owner)
-
-    def _fetch_subtitle_tracks(self, session_id=None):
+    def _fetch_subtitle_tracks(self, session_id=None, track_list=None):
         logger.info("[SUBTITLE] _fetch_subtitle_tracks called")
         owner = self._media_session_id if session_id is None else session_id
         if not self._session_is_current(owner):
@@ -788,7 +820,8 @@ class SubtitleTrackMixin:
             if not self.player:
                 logger.info("[SUBTITLE] player is None, returning")
                 return
-            track_list = self.player.track_list
+            if track_list is None:
+                track_list = self.player.track_list
             logger.info(f"[SUBTITLE] track_list has {len(track_list)} tracks")
             lang_map = self._get_clpi_lang_map()
             subtitle_tracks = []
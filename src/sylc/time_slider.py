@@ -1,19 +1,21 @@
 # -*- coding: utf-8 -*-
-"""Timeline slider and its isolated thumbnail extraction helpers."""
+"""Thumbnail extraction helpers for the timeline slider.
 
+The widget consuming these is PremiumTimelineSlider (premium_controls_overlay);
+this module stays Qt-light so the extraction pipeline — executor, per-file disk
+cache, mpv/ffmpeg single-frame grabs and the sprite-sheet atlas — can run and
+be tested without a live slider."""
+
+import hashlib
 import logging
 import os
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 
-from PySide6.QtCore import QPoint, QPointF, Qt, QTimer, Signal, Slot
-from PySide6.QtGui import QBrush, QColor, QPainter, QPen, QPixmap
-from PySide6.QtWidgets import QSlider
-
-from sylc.player_widgets import PreviewTooltip
 from sylc.video_3d_analyzer import _resolve_external_tool
 
 
@@ -21,41 +23,321 @@ logger = logging.getLogger(__name__)
 
 _thumbnail_executor = ThreadPoolExecutor(max_workers=2)
 
+# ffmpeg defaults to min(cpu_count, 16) decode threads per process; two
+# concurrent extractions on a quad-core box would spawn dozens of threads
+# right while the user is scrubbing. Split the cores across the executor's
+# workers instead, overridable via SYLC_THUMB_FFMPEG_THREADS.
+_FFMPEG_THREADS = int(os.environ.get(
+    'SYLC_THUMB_FFMPEG_THREADS', '') or max(1, (os.cpu_count() or 2) // 2))
+
+# Persistent thumbnail cache: warm scrubs of the same file skip ffmpeg entirely
+# and pay only a QPixmap load. Keyed by (path, mtime) so an edited/re-muxed file
+# never serves stale frames; entries inside are named by the rounded second.
+_THUMB_DISK_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'sylc_thumbs')
+_THUMB_DISK_CACHE_CAP_BYTES = 200 * 1024 * 1024
+
+
+def _video_cache_id(video_file):
+    """Stable identity of a file's current contents: sha1 of path + mtime.
+
+    Returns None when the file cannot be stat'ed (vanished, unmounted
+    volume). The disk cache keys on it so an edited/re-muxed file never
+    serves stale frames."""
+    try:
+        mtime = os.path.getmtime(video_file)
+    except OSError:
+        return None
+    return hashlib.sha1(
+        f"{video_file}|{mtime}".encode('utf-8', 'replace')).hexdigest()
+
+
+def _thumb_cache_dir(video_file):
+    """Per-file cache directory under the shared thumbnail cache root.
+
+    Returns None when the file cannot be stat'ed — callers then fall back to
+    uncached extraction."""
+    key = _video_cache_id(video_file)
+    if key is None:
+        return None
+    return os.path.join(_THUMB_DISK_CACHE_DIR, key)
+
+
+def _thumb_cache_path(video_file, time_pos):
+    cache_dir = _thumb_cache_dir(video_file)
+    if cache_dir is None:
+        return None
+    return os.path.join(cache_dir, f"{round(time_pos)}.jpg")
+
+
+def _cached_thumbnail(video_file, time_pos):
+    """Extract-with-memoization wrapper around _extract_thumbnail_single.
+
+    Returns JPEG bytes. Disk-cache hit → one small file read, no subprocess.
+    Miss → extract (bytes stay in memory end-to-end), then publish into the
+    cache via a temp file + os.replace so a concurrent reader never sees a
+    half-written entry."""
+    cache_path = _thumb_cache_path(video_file, time_pos)
+    if cache_path is None:
+        return _extract_thumbnail_single(video_file, time_pos)
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as fh:
+                return fh.read()
+        except OSError:
+            pass
+    data = _extract_thumbnail_single(video_file, time_pos)
+    if not data:
+        return None
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as fh:
+            fh.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return data
+
+
+def _sweep_thumb_cache(cap_bytes=_THUMB_DISK_CACHE_CAP_BYTES):
+    """Evict least-recently-used cached thumbnails once the cache exceeds the
+    cap. Runs on the extraction executor (never the GUI thread), once per
+    set_video_file."""
+    entries = []
+    try:
+        with os.scandir(_THUMB_DISK_CACHE_DIR) as roots:
+            for sub in roots:
+                if not sub.is_dir():
+                    continue
+                try:
+                    with os.scandir(sub.path) as files:
+                        for entry in files:
+                            if entry.is_file():
+                                st = entry.stat()
+                                entries.append((st.st_atime, st.st_size, entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    if total <= cap_bytes:
+        return
+    entries.sort()      # oldest atime first
+    for _, size, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= cap_bytes:
+            break
+
+
+_ATLAS_COLS = 20
+_ATLAS_ROWS = 10
+_ATLAS_TILE_W = 120
+_ATLAS_TILE_H = 68
+_ATLAS_TIMEOUT_S = 120.0
+
+
+def _extract_thumbnail_atlas(video_file, duration):
+    """Build ONE sprite-sheet JPEG (20x10 tiles of 120x68) for the whole video.
+
+    The VLC/YouTube seekbar pattern: a single ffmpeg pass samples the file at
+    tiles/duration fps and tiles the frames into one image. Hover lookups then
+    crop from the atlas with QPixmap.copy — zero subprocess, zero disk I/O per
+    hover after warmup. The atlas lives in the per-file disk cache, so a warm
+    start skips ffmpeg entirely. Returns (atlas_path, count, stride_seconds) or
+    None; callers keep the single-frame path as fallback."""
+    try:
+        duration = float(duration)
+        count = _ATLAS_COLS * _ATLAS_ROWS
+        if duration <= count * 0.5:     # too short for a meaningful atlas
+            count = max(2, int(duration))
+        if duration <= 0 or count < 2:
+            return None
+        stride = duration / count
+        cache_dir = _thumb_cache_dir(video_file)
+        if cache_dir:
+            atlas_path = os.path.join(cache_dir, 'atlas.jpg')
+            if os.path.exists(atlas_path):
+                return atlas_path, count, stride
+        else:
+            atlas_path = os.path.join(
+                tempfile.gettempdir(), f"sylc_atlas_{int(time.time() * 1000000)}.jpg")
+        ffmpeg_path = _resolve_external_tool('ffmpeg')
+        if not ffmpeg_path:
+            return None
+        # The output lands inside the per-file cache directory: it must exist
+        # BEFORE ffmpeg opens temp_path, or every cold-cache build fails.
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        temp_path = atlas_path + '.tmp.jpg'
+        cmd = [
+            ffmpeg_path,
+            # Same decode-thread cap as the single-frame path: the atlas pass
+            # decodes the WHOLE file, so an uncapped run is the worst offender
+            # for starving the playback decoder of cores.
+            '-threads', str(_FFMPEG_THREADS),
+            '-filter_threads', '1',
+            '-i', video_file,
+            '-vf', (f'fps={count / duration:.6f},'
+                    f'scale={_ATLAS_TILE_W}:{_ATLAS_TILE_H},'
+                    f'tile={_ATLAS_COLS}x{_ATLAS_ROWS}'),
+            '-frames:v', '1',
+            '-q:v', '8',
+            '-y',
+            temp_path,
+        ]
+        creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=_ATLAS_TIMEOUT_S,
+            creationflags=creationflags
+        )
+        if result.returncode != 0 or not os.path.exists(temp_path):
+            return None
+        os.replace(temp_path, atlas_path)
+        return atlas_path, count, stride
+    except Exception:
+        return None
+
+
+# One shared headless mpv instance, reused across hovers: the decoder is
+# initialized ONCE per file instead of once per ffmpeg launch, so a warm
+# preview costs a seek + decode, not a process spawn + header re-parse.
+# The lock serializes seeks on the single instance.
+_preview_mpv = None
+_preview_mpv_file = None
+_preview_mpv_lock = threading.Lock()
+_PREVIEW_MPV_DEADLINE_S = 2.0
+
+
+def _extract_thumbnail_mpv(video_file, time_pos):
+    """Grab one frame through the shared headless mpv instance.
+
+    Returns JPEG bytes, or None when python-mpv is unavailable or the grab
+    times out — callers then fall back to the per-hover ffmpeg path. The
+    instance is created lazily and kept across calls; only a file change
+    reloads it."""
+    global _preview_mpv, _preview_mpv_file
+    try:
+        import mpv
+    except Exception:
+        return None
+    with _preview_mpv_lock:
+        try:
+            if _preview_mpv is None:
+                _preview_mpv = mpv.MPV(
+                    vo='null', audio='no', hwdec='no',
+                    pause='yes', keep_open='yes')
+            player = _preview_mpv
+            deadline = time.monotonic() + _PREVIEW_MPV_DEADLINE_S
+            if _preview_mpv_file != video_file:
+                player.loadfile(video_file)
+                _preview_mpv_file = video_file
+                while not player.duration:
+                    if time.monotonic() > deadline:
+                        _preview_mpv_file = None
+                        return None
+                    time.sleep(0.01)
+            player.seek(time_pos, 'absolute', 'exact')
+            while player.seeking:
+                if time.monotonic() > deadline:
+                    return None
+                time.sleep(0.01)
+            temp_file = os.path.join(
+                tempfile.gettempdir(), f"preview_{int(time.time() * 1000000)}.jpg")
+            player.screenshot_to_file(temp_file, includes='video')
+            if not os.path.exists(temp_file):
+                return None
+            # mpv only writes to a path; slurp + unlink so the rest of the
+            # pipeline stays a pure bytes handoff.
+            try:
+                with open(temp_file, 'rb') as fh:
+                    return fh.read()
+            finally:
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
+        except Exception:
+            # Self-heal on the next hover: a wedged instance is dropped whole.
+            try:
+                _preview_mpv.terminate()
+            except Exception:
+                pass
+            _preview_mpv = None
+            _preview_mpv_file = None
+            return None
+
+
+def shutdown_preview_mpv():
+    """Terminate the shared headless mpv instance (app shutdown).
+
+    libmpv keeps its own event thread alive until terminate(); leaving the
+    preview instance running would hold the last previewed file open past
+    close (blocking ISO dismount on Windows) and leak the handle."""
+    global _preview_mpv, _preview_mpv_file
+    with _preview_mpv_lock:
+        if _preview_mpv is not None:
+            try:
+                _preview_mpv.terminate()
+            except Exception:
+                pass
+            _preview_mpv = None
+            _preview_mpv_file = None
+
+
+def _extract_thumbnail_single(video_file, time_pos):
+    """Single-frame extraction: shared mpv instance first (no subprocess),
+    per-hover ffmpeg as the fallback. Returns JPEG bytes or None."""
+    return (_extract_thumbnail_mpv(video_file, time_pos)
+            or _extract_thumbnail_ffmpeg(video_file, time_pos))
+
 
 def _extract_thumbnail_ffmpeg(video_file, time_pos):
-    """Extract a thumbnail with ffmpeg (worker function for ThreadPoolExecutor)."""
+    """Extract one thumbnail with ffmpeg (worker function for ThreadPoolExecutor).
+
+    The JPEG comes back on stdout via image2pipe — a pure memory handoff. The
+    old temp-file route cost a filesystem write + QPixmap re-read + unlink per
+    hover for an image that only ever lives in the tooltip."""
     try:
         ffmpeg_path = _resolve_external_tool('ffmpeg')
         if not ffmpeg_path:
             logger.warning("[PREVIEW] ffmpeg not found. Preview thumbnails disabled.")
             return None
 
-        temp_file = os.path.join(tempfile.gettempdir(), f"preview_{int(time.time() * 1000000)}.jpg")
-
         cmd = [
             ffmpeg_path,
+            '-threads', str(_FFMPEG_THREADS),
+            '-filter_threads', '1',
             '-ss', str(time_pos),
             '-i', video_file,
             '-frames:v', '1',
-            '-vf', 'scale=120:-1',
-            '-q:v', '8',
-            '-y',
-            temp_file
+            '-vf', 'scale=320:-1',  # XL tooltip blits a 320x180 rect
+            '-q:v', '5',
+            '-f', 'image2pipe',
+            '-vcodec', 'mjpeg',
+            '-'
         ]
 
         creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
         result = subprocess.run(
             cmd,
-            stdout=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
             timeout=2.0,
             creationflags=creationflags
         )
 
-        if result.returncode == 0 and os.path.exists(temp_file):
-            return temp_file
+        if result.returncode == 0 and result.stdout:
+            return result.stdout
         return None
-    except:
+    except Exception:
+        logger.debug("[PREVIEW] ffmpeg extraction failed", exc_info=True)
         return None
 
 
@@ -103,175 +385,8 @@ def _decide_thumbs_mode(file_path, mounted_iso_letters, optical_letters, codec_n
     return ('edge264', False) if is_h264 else ('avcodec', False)
 
 
-class TimeSlider(QSlider):
-    """Custom slider with time preview on hover."""
-
-    preview_requested = Signal(float)
-    extraction_done = Signal(float, str)
-
-    def __init__(self, orientation, parent=None):
-        super().__init__(orientation, parent)
-        self.setMouseTracking(True)
-        self._hover_time = 0
-        self._is_hovering = False
-        self._player = None
-        self._preview_widget = PreviewTooltip(self)
-        self._last_preview_time = -99
-        self._preview_cache = {}  # LRU cache (100 frames)
-        self._video_file = None
-        self._extraction_timer = None  # Lazy initialization
-        self._timer_initialized = False
-        self._pending_time = 0
-        self._pending_mouse_x = 0
-        self.extraction_done.connect(self._on_extraction_done)
-
-    def _ensure_timer_initialized(self):
-        """Initialize extraction timer in GUI thread when first needed"""
-        if not self._timer_initialized:
-            self._extraction_timer = QTimer(self)
-            self._extraction_timer.setSingleShot(True)
-            self._extraction_timer.timeout.connect(self._do_extraction)
-            self._timer_initialized = True
-
-    def enterEvent(self, event):
-        super().enterEvent(event)
-        self._is_hovering = True
-        self.update()
-
-    def set_player(self, player):
-        self._player = player
-
-    def mouseMoveEvent(self, event):
-        if self.maximum() > 0:
-            pos = event.position().x() if hasattr(event, 'position') else event.pos().x()
-            value = int((pos / self.width()) * self.maximum())
-            self._hover_time = max(0, min(value, self.maximum()))
-            self._is_hovering = True
-
-            s = int(self._hover_time)
-            h, s = divmod(s, 3600)
-            m, s = divmod(s, 60)
-            time_str = f"{h:02}:{m:02}:{s:02}"
-            self.setToolTip(time_str)
-
-            if self._video_file and abs(self._hover_time - self._last_preview_time) > 0.5:
-                self._last_preview_time = self._hover_time
-                self._request_on_demand_preview(self._hover_time, pos)
-
-            self.update()
-        super().mouseMoveEvent(event)
-
-    def set_video_file(self, file_path: str, duration_seconds: float):
-        """V7b+++++ PREVIEW FIX: Restore set_video_file for thumbnail preview.
-
-        This method was mistakenly removed in a previous fix. It's required for
-        the preview tooltip to work - without it, _video_file stays None and
-        no thumbnails are extracted on hover.
-
-        Args:
-            file_path: Path to the video file (MKV, M2TS, etc.)
-            duration_seconds: Video duration in seconds
-        """
-        self._video_file = file_path
-        if duration_seconds > 0:
-            self.setRange(0, int(duration_seconds))
-        # Clear preview cache when video changes
-        self._preview_cache.clear()
-        self._last_preview_time = -99
-        logger.info(f"[PREVIEW] Video file set: {file_path}, duration={duration_seconds:.1f}s")
-
-    def _request_on_demand_preview(self, time_pos, mouse_x):
-        cache_key = round(time_pos)
-        if cache_key in self._preview_cache:
-            pixmap = self._preview_cache[cache_key]
-            if not pixmap.isNull():
-                self._preview_widget.setPixmap(pixmap)
-                self._show_preview_at(mouse_x)
-                return
-
-        self._pending_time = time_pos
-        self._pending_mouse_x = mouse_x
-        self._ensure_timer_initialized()  # Lazy timer creation
-        self._extraction_timer.start(100)
-
-    def _do_extraction(self):
-        time_pos = self._pending_time
-        mouse_x = self._pending_mouse_x
-        future = _thumbnail_executor.submit(_extract_thumbnail_ffmpeg, self._video_file, time_pos)
-        future.add_done_callback(lambda f: self._handle_extraction_result(f, time_pos, mouse_x))
-
-    def _handle_extraction_result(self, future, time_pos, mouse_x):
-        try:
-            temp_file = future.result()
-            if temp_file:
-                self.extraction_done.emit(time_pos, temp_file)
-        except:
-            pass
-
-    @Slot(float, str)
-    def _on_extraction_done(self, time_pos, temp_file):
-        try:
-            cache_key = round(time_pos)
-            pixmap = QPixmap(temp_file)
-            if not pixmap.isNull():
-                if len(self._preview_cache) > 100:
-                    oldest = next(iter(self._preview_cache))
-                    del self._preview_cache[oldest]
-                self._preview_cache[cache_key] = pixmap
-                if self._is_hovering and abs(time_pos - self._hover_time) < 3:
-                    self._preview_widget.setPixmap(pixmap)
-                    self._show_preview_at(self._pending_mouse_x)
-            try:
-                os.remove(temp_file)
-            except:
-                pass
-        except Exception as e:
-            print(f"[ERROR] {e}")
-
-    def _show_preview_at(self, mouse_x):
-        # FIX VIGNETTE : Lecture persistante de la propriété définie par le HUD
-        if self.property('hud_mode'):
-            self._preview_widget.hide()
-            self.update()
-            return
-
-        global_pos = self.mapToGlobal(QPoint(int(mouse_x), 0))
-        tooltip_x = global_pos.x() - self._preview_widget.width() // 2
-        tooltip_y = global_pos.y() - self._preview_widget.height() - 10
-
-        self._preview_widget.move(tooltip_x, tooltip_y)
-        self._preview_widget.show()
-        self._preview_widget.raise_()
-
-    def leaveEvent(self, event):
-        super().leaveEvent(event)
-        self._is_hovering = False
-        self.setToolTip("")
-        self._preview_widget.hide()
-        self.update()
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton and self.maximum() > 0:
-            pos = event.position().x() if hasattr(event, 'position') else event.pos().x()
-            value = int((pos / self.width()) * self.maximum())
-            self.setValue(max(0, min(value, self.maximum())))
-            self.sliderMoved.emit(self.value())
-        super().mousePressEvent(event)
-
-    def paintEvent(self, event):
-        super().paintEvent(event)
-        if self._is_hovering and self.maximum() > 0:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-            preview_x = int((self._hover_time / self.maximum()) * self.width())
-            painter.setPen(QPen(QColor(0, 122, 204, 180), 2))
-            painter.drawLine(preview_x, 0, preview_x, self.height())
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(QColor(0, 122, 204, 220)))
-            painter.drawEllipse(QPointF(preview_x, self.height() // 2), 5, 5)
-
 __all__ = [
-    'TimeSlider', '_decide_thumbs_mode', '_extract_thumbnail_ffmpeg',
+    '_cached_thumbnail', '_decide_thumbs_mode', '_extract_thumbnail_ffmpeg',
+    'shutdown_preview_mpv',
 ]
 
@@ -5,9 +5,13 @@ import glob
 import json
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
 from sylc.stereo_eye_order import (
@@ -15,6 +19,15 @@ from sylc.stereo_eye_order import (
     normalise_eye_order,
 )
 
+# ffprobe JSON parsing: orjson (native parser, 2-5x faster on medium JSON)
+# when installed, stdlib json otherwise. Both consume the raw stdout bytes,
+# and orjson.JSONDecodeError subclasses json.JSONDecodeError so the existing
+# error handling covers either parser. Never a hard dependency.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 APP_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -25,6 +38,7 @@ def configure_app_base_dir(path):
     global APP_BASE_DIR
     APP_BASE_DIR = os.path.abspath(path)
     _resolve_external_tool.cache_clear()
+    _check_ffmpeg_runtime.cache_clear()
 
 @lru_cache(maxsize=None)
 def _resolve_external_tool(executable_name):
@@ -52,6 +66,7 @@ def _resolve_external_tool(executable_name):
     return None
 
 
+@lru_cache(maxsize=32)
 def _describe_windows_returncode(returncode):
     """Return a human readable explanation for common Windows subprocess errors."""
     if returncode in (3221225781, -1073741515):  # 0xC0000135
@@ -70,10 +85,16 @@ def _describe_windows_returncode(returncode):
     return None
 
 
+@lru_cache(maxsize=None)
 def _check_ffmpeg_runtime(executable_path):
     """
     Checks if essential DLLs for ffmpeg/ffprobe are present (Windows).
 
+    Cached per executable path: the glob scans ran on EVERY analyze_file call
+    (3N directory reads for an N-file batch) for a filesystem state that is
+    stable over a process lifetime. Dropping DLLs next to the tools mid-session
+    therefore needs a restart (or configure_app_base_dir) to be noticed.
+
     Returns:
         str | None: error message if a dependency is missing.
     """
@@ -108,6 +129,56 @@ def _check_ffmpeg_runtime(executable_path):
     return None
 
 
+# --- per-file analysis cache -------------------------------------------------
+# ffprobe re-ran on every open of the same title (replay, playlist revisit)
+# for metadata that cannot change while (mtime, size) hold. One JSON map in
+# the user profile, same constraints as playback_memory: never raise into the
+# player, atomic writes, bounded. SYLC_ANALYSIS_CACHE is the test-isolation
+# override, mirroring SYLC_PLAYBACK_MEMORY.
+_ANALYSIS_CACHE_MAX = 400
+_analysis_cache = None
+
+
+def _analysis_cache_path():
+    return (os.environ.get('SYLC_ANALYSIS_CACHE')
+            or os.path.join(os.path.expanduser('~'),
+                            '.sylc3d_analysis_cache.json'))
+
+
+def _load_analysis_cache():
+    global _analysis_cache
+    if _analysis_cache is None:
+        try:
+            with open(_analysis_cache_path(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            _analysis_cache = data if isinstance(data, dict) else {}
+        except Exception:
+            _analysis_cache = {}
+    return _analysis_cache
+
+
+def _save_analysis_cache(cache):
+    try:
+        path = _analysis_cache_path()
+        directory = os.path.dirname(path) or '.'
+        fd, tmp = tempfile.mkstemp(prefix='.sylc3d_analysis-',
+                                   suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=1)
+            os.replace(tmp, path)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    except Exception:
+        # Losing one cache update must never interfere with playback; the
+        # next successful save catches up.
+        pass
+
+
 _STEREO_PRIORITY = {
     'none': 0,
     'tab': 1,
@@ -117,8 +188,35 @@ _STEREO_PRIORITY = {
 }
 
 
+# Keyword scanners for _classify_stereo_mode: one precompiled alternation per
+# category, tried in priority order. A single C-level regex scan replaces the
+# ~30 Python substring tests the old branch chain performed per call — same
+# substring semantics, far fewer interpreter round-trips on metadata-heavy
+# files (the classifier runs once per stream field/tag/side-data entry).
+_STEREO_PATTERNS = (
+    ('anaglyph', re.compile(
+        'anaglyph|cyan|magenta')),
+    ('mvc', re.compile(
+        'frame_altern|framealternate|frame_packing|frame_sequential|'
+        'frame_packed|view_packed|mvc|framepacking|frameinterleaved|'
+        'block_lr|block_rl|packed')),
+    ('tab', re.compile(
+        'top_bottom|bottom_top|tab|over_under|under_over|'
+        'block_tb|block_bt|topbottom|bt|tb')),
+    ('sbs', re.compile(
+        'side_by_side|sbs|left_right|right_left|'
+        'row_interleaved|column_interleaved')),
+)
+
+
+@lru_cache(maxsize=256)
 def _classify_stereo_mode(mode_str):
-    """Normalizes a stereo_mode value to sbs/tab/mvc/anaglyph."""
+    """Normalizes a stereo_mode value to sbs/tab/mvc/anaglyph.
+
+    Pure and keyed on a short string; real corpora repeat the same handful of
+    tag values ("top_bottom", "side_by_side", "mvc_stereo") across streams
+    and files, so repeat calls collapse to a dict lookup. None results are
+    cached too."""
     if not mode_str:
         return None
 
@@ -134,27 +232,9 @@ def _classify_stereo_mode(mode_str):
     if mode in ('mono', 'left', 'right', 'both', '2d'):
         return None
 
-    if any(keyword in mode for keyword in ('anaglyph', 'cyan', 'magenta', 'red_cyan', 'cyan_red')):
-        return 'anaglyph'
-
-    if any(keyword in mode for keyword in (
-            'frame_altern', 'framealternate', 'frame_packing', 'frame_sequential',
-            'frame_packed', 'view_packed', 'mvc', 'framepacking', 'frameinterleaved',
-            'block_lr', 'block_rl', 'packed'
-    )):
-        return 'mvc'
-
-    if any(keyword in mode for keyword in (
-            'top_bottom', 'bottom_top', 'tab', 'over_under', 'under_over',
-            'block_tb', 'block_bt', 'topbottom', 'bt', 'tb'
-    )):
-        return 'tab'
-
-    if any(keyword in mode for keyword in (
-            'side_by_side', 'sbs', 'left_right', 'right_left',
-            'row_interleaved', 'column_interleaved'
-    )):
-        return 'sbs'
+    for category, pattern in _STEREO_PATTERNS:
+        if pattern.search(mode):
+            return category
 
     return None
 
@@ -281,6 +361,51 @@ class Video3DAnalyzer:
     Uses ffprobe to extract metadata.
     """
 
+    @staticmethod
+    def analyze_files(file_paths):
+        """
+        Analyzes several files concurrently and returns their 3D properties
+        in input order.
+
+        analyze_file spends nearly all of its time blocked on ffprobe, so a
+        playlist import parallelizes cleanly across a small thread pool.
+        """
+        with ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 4)) as executor:
+            return list(executor.map(Video3DAnalyzer.analyze_file, file_paths))
+
+    @staticmethod
+    def analyze_file_cached(file_path):
+        """analyze_file behind a per-file cache keyed on path + (mtime, size).
+
+        The probe result is a pure function of the file's bytes, so replaying
+        a title skips the ffprobe launch entirely. Results carrying an
+        analysis_error are never cached — a missing tool or a timeout must be
+        retried on the next open, not remembered.
+        """
+        try:
+            st = os.stat(file_path)
+            key = os.path.normcase(os.path.abspath(file_path))
+        except OSError:
+            return Video3DAnalyzer.analyze_file(file_path)
+        cache = _load_analysis_cache()
+        rec = cache.get(key)
+        if (isinstance(rec, dict) and rec.get('mtime') == st.st_mtime
+                and rec.get('size') == st.st_size
+                and isinstance(rec.get('info'), dict)):
+            return dict(rec['info'])
+        info = Video3DAnalyzer.analyze_file(file_path)
+        if not info.get('analysis_error'):
+            cache[key] = {'mtime': st.st_mtime, 'size': st.st_size,
+                          'updated': time.time(), 'info': dict(info)}
+            if len(cache) > _ANALYSIS_CACHE_MAX:
+                by_age = sorted(cache.items(),
+                                key=lambda kv: kv[1].get('updated', 0.0))
+                for stale_key, _ in by_age[:len(cache) - _ANALYSIS_CACHE_MAX]:
+                    del cache[stale_key]
+            _save_analysis_cache(cache)
+        return info
+
     @staticmethod
     def analyze_file(file_path):
         """
@@ -336,12 +461,28 @@ class Video3DAnalyzer:
                 result['analysis_error'] = runtime_issue
                 raise FileNotFoundError(runtime_issue)
 
+            # Only the fields the analysis below actually reads: full
+            # -show_streams/-show_format output runs to tens of KB on
+            # multi-audio Blu-ray rips, all of it serialized by ffprobe and
+            # decoded/parsed here. format=duration stays — it is the primary
+            # duration source before the per-stream fallback. Disposition,
+            # tags and Stereo3D side data are CHILD SECTIONS in ffprobe's
+            # section model, selected by their own section names — listing
+            # them as stream= entries silently drops them from the JSON (and
+            # with them MVC dependent-track detection and every tag/side-data
+            # stereo signal for MKV sources).
             cmd = [
                 ffprobe_path,
                 '-v', 'error',
                 '-print_format', 'json',
-                '-show_streams',
-                '-show_format',
+                '-show_entries',
+                ('stream=codec_type,codec_name,profile,width,height,'
+                 'avg_frame_rate,r_frame_rate,duration,stereo_mode,'
+                 'stereo_mode_name'
+                 ':stream_disposition'
+                 ':stream_tags'
+                 ':side_data'
+                 ':format=duration'),
                 file_path
             ]
 
@@ -350,10 +491,13 @@ class Video3DAnalyzer:
                 creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
 
             try:
+                # Raw bytes end-to-end: json.loads consumes the stdout buffer
+                # directly, skipping the intermediate str copy a text=True
+                # decode would allocate for multi-stream probe outputs. The
+                # run() watchdog keeps the 30s hang protection (.ssif lesson).
                 completed = subprocess.run(
                     cmd,
                     capture_output=True,
-                    text=True,
                     check=True,
                     timeout=_FFPROBE_ANALYSIS_TIMEOUT_S,
                     creationflags=creationflags
@@ -374,10 +518,8 @@ class Video3DAnalyzer:
                 result['analysis_error'] = f"ffprobe failed: {e}"
                 return _apply_filename_3d_hint(result, file_path)
 
-            data = json.loads(completed.stdout or "{}")
+            data = _json_loads(completed.stdout or b"{}")
             streams = data.get('streams', [])
-            result['has_audio'] = any(
-                stream.get('codec_type') == 'audio' for stream in streams)
 
             format_info = data.get('format', {})
             duration_str = format_info.get('duration')
@@ -387,99 +529,138 @@ class Video3DAnalyzer:
                 except ValueError:
                     pass
 
+            # ONE walk over the streams list: audio detection, the separate
+            # dependent-view MVC track, the per-stream duration fallback and
+            # the main video heuristics all used to be independent passes.
+            has_audio = False
+            fallback_duration = None
             for stream_index, stream in enumerate(streams):
-                if stream.get('codec_type') == 'video':
-                    result['width'] = stream.get('width', 0)
-                    result['height'] = stream.get('height', 0)
-                    fps_value = _parse_ffprobe_fps(stream.get('avg_frame_rate')) or \
-                                _parse_ffprobe_fps(stream.get('r_frame_rate'))
-                    if fps_value:
-                        result['fps'] = fps_value
-                    width = result['width']
-                    height = result['height']
-
-                    codec_name = (stream.get('codec_name') or '').lower()
-                    profile = (stream.get('profile') or '').lower()
-                    # Remember the video codec so the player can decide whether
-                    # to use the edge264 path (H.264) or fall back to MPV native.
-                    # C1: this MUST be read BEFORE the framepack heuristic below so the
-                    # heuristic can be gated on the codec.
-                    if codec_name and not result['codec_name']:
-                        result['codec_name'] = codec_name
-
-                    # C1: the framepack-dimension heuristic (1920x2205/2160, 3840x4320)
-                    # forces stereo_mode='mvc', routing the file to the MVC (edge264)
-                    # decoder. That is correct for H.264/MVC packed streams, but it MUST
-                    # NOT fire for an FTAB *HEVC* clip (same 1920x2160 / 3840x4320 dims):
-                    # HEVC has its own avcodec path (_try_start_hevc) and, once marked
-                    # 'mvc', would be sent to the MVC decoder and never reach it. So only
-                    # apply the heuristic for h264/mvc or an unknown/empty codec — never
-                    # for hevc. Behaviour for h264/mvc/no-codec is unchanged.
-                    is_framepacked = (
-                        ((width == 1920 and height in [2205, 2160])
-                         or (width == 3840 and height == 4320))
-                        and codec_name in ('h264', 'mvc', '')
-                    )
-
-                    if is_framepacked:
+                if fallback_duration is None:
+                    dur = stream.get('duration')
+                    if dur:
+                        try:
+                            fallback_duration = float(dur)
+                        except ValueError:
+                            pass
+                codec_type = stream.get('codec_type')
+                if codec_type != 'video':
+                    if codec_type == 'audio':
+                        has_audio = True
+                    # A dependent-view track remuxed as its own stream probes
+                    # with codec 'mvc' and no video dimensions.
+                    elif stream.get('codec_name') == 'mvc':
                         result['is_3d'] = True
                         result['has_mvc_track'] = True
                         result['stereo_mode'] = 'mvc'
+                    continue
+                width = stream.get('width', 0)
+                height = stream.get('height', 0)
+                result['width'] = width
+                result['height'] = height
+                fps_value = _parse_ffprobe_fps(stream.get('avg_frame_rate')) or \
+                            _parse_ffprobe_fps(stream.get('r_frame_rate'))
+                if fps_value:
+                    result['fps'] = fps_value
+
+                codec_name = (stream.get('codec_name') or '').lower()
+                profile = (stream.get('profile') or '').lower()
+                # Remember the video codec so the player can decide whether
+                # to use the edge264 path (H.264) or fall back to MPV native.
+                # C1: this MUST be read BEFORE the framepack heuristic below so the
+                # heuristic can be gated on the codec.
+                if codec_name and not result['codec_name']:
+                    result['codec_name'] = codec_name
+
+                # A video track probing as codec 'mvc' is always 3D (this used
+                # to be the second streams pass, now folded in).
+                if codec_name == 'mvc':
+                    result['is_3d'] = True
+                    result['has_mvc_track'] = True
+                    result['stereo_mode'] = 'mvc'
+
+                # C1: the framepack-dimension heuristic (1920x2205/2160, 3840x4320)
+                # forces stereo_mode='mvc', routing the file to the MVC (edge264)
+                # decoder. That is correct for H.264/MVC packed streams, but it MUST
+                # NOT fire for an FTAB *HEVC* clip (same 1920x2160 / 3840x4320 dims):
+                # HEVC has its own avcodec path (_try_start_hevc) and, once marked
+                # 'mvc', would be sent to the MVC decoder and never reach it. So only
+                # apply the heuristic for h264/mvc or an unknown/empty codec — never
+                # for hevc. Behaviour for h264/mvc/no-codec is unchanged.
+                is_framepacked = (
+                    ((width == 1920 and height in [2205, 2160])
+                     or (width == 3840 and height == 4320))
+                    and codec_name in ('h264', 'mvc', '')
+                )
+
+                if is_framepacked:
+                    result['is_3d'] = True
+                    result['has_mvc_track'] = True
+                    result['stereo_mode'] = 'mvc'
 
-                    if codec_name in ('mvc', 'h264'):
-                        if 'stereo' in profile or 'mvc' in profile:
-                            _promote_stereo_mode(result, 'mvc', mark_mvc=True)
-
-                    # Some ffprobe builds expose Matroska StereoMode directly on
-                    # AVStream instead of under tags/side_data_list.
-                    for field_name in ('stereo_mode', 'stereo_mode_name'):
-                        raw_stereo = stream.get(field_name)
-                        classified = _classify_stereo_mode(raw_stereo)
-                        if classified:
-                            _promote_stereo_mode(
-                                result, classified,
-                                mark_mvc=(classified == 'mvc'),
-                                eye_order=eye_order_from_stereo_value(raw_stereo),
-                                eye_order_source=f'ffprobe stream {stream_index}.{field_name}')
-
-                    disposition = stream.get('disposition') or {}
-                    if isinstance(disposition, dict) and disposition.get('dependent'):
+                if codec_name in ('mvc', 'h264'):
+                    if 'stereo' in profile or 'mvc' in profile:
                         _promote_stereo_mode(result, 'mvc', mark_mvc=True)
 
-                    if not is_framepacked:
-                        for side_data in stream.get('side_data_list', []):
-                            side_type = (
-                                    side_data.get('side_data_type')
+                # Terminal state: 'mvc' tops _STEREO_PRIORITY, so once locked
+                # the remaining metadata scans can only re-confirm it. Keep
+                # scanning only while the eye order is still unknown — that
+                # refinement (Stereo3D side-data, StereoMode tags) must never
+                # be lost to the short-circuit.
+                if (result['has_mvc_track'] and result['stereo_mode'] == 'mvc'
+                        and result['eye_order'] != UNKNOWN):
+                    continue
+
+                # Some ffprobe builds expose Matroska StereoMode directly on
+                # AVStream instead of under tags/side_data_list.
+                for field_name in ('stereo_mode', 'stereo_mode_name'):
+                    raw_stereo = stream.get(field_name)
+                    classified = _classify_stereo_mode(raw_stereo)
+                    if classified:
+                        _promote_stereo_mode(
+                            result, classified,
+                            mark_mvc=(classified == 'mvc'),
+                            eye_order=eye_order_from_stereo_value(raw_stereo),
+                            eye_order_source=f'ffprobe stream {stream_index}.{field_name}')
+
+                disposition = stream.get('disposition')
+                if disposition and disposition.get('dependent'):
+                    _promote_stereo_mode(result, 'mvc', mark_mvc=True)
+
+                if not is_framepacked:
+                    for side_data in stream.get('side_data_list') or ():
+                        side_type = (
+                                side_data.get('side_data_type')
+                                or side_data.get('type')
+                                or ''
+                        ).lower()
+                        if ('stereo3d' in side_type or 'stereo_3d' in side_type
+                                or 'stereo 3d' in side_type):
+                            detected = (
+                                    side_data.get('stereo_mode')
                                     or side_data.get('type')
+                                    or side_data.get('layout')
+                                    or side_data.get('view')
                                     or ''
-                            ).lower()
-                            if ('stereo3d' in side_type or 'stereo_3d' in side_type
-                                    or 'stereo 3d' in side_type):
-                                detected = (
-                                        side_data.get('stereo_mode')
-                                        or side_data.get('type')
-                                        or side_data.get('layout')
-                                        or side_data.get('view')
-                                        or ''
-                                )
-                                classified = _classify_stereo_mode(detected)
-                                inverted_flag = side_data.get('inverted')
-                                order = eye_order_from_stereo_value(
-                                    detected, inverted=inverted_flag)
-                                if classified == 'mvc':
-                                    _promote_stereo_mode(
-                                        result, 'mvc', mark_mvc=True,
-                                        eye_order=order,
-                                        eye_order_source=(
-                                            f'ffprobe stream {stream_index} Stereo3D'))
-                                elif classified:
-                                    _promote_stereo_mode(
-                                        result, classified,
-                                        eye_order=order,
-                                        eye_order_source=(
-                                            f'ffprobe stream {stream_index} Stereo3D'))
-
-                        tags = stream.get('tags') or {}
+                            )
+                            classified = _classify_stereo_mode(detected)
+                            inverted_flag = side_data.get('inverted')
+                            order = eye_order_from_stereo_value(
+                                detected, inverted=inverted_flag)
+                            if classified == 'mvc':
+                                _promote_stereo_mode(
+                                    result, 'mvc', mark_mvc=True,
+                                    eye_order=order,
+                                    eye_order_source=(
+                                        f'ffprobe stream {stream_index} Stereo3D'))
+                            elif classified:
+                                _promote_stereo_mode(
+                                    result, classified,
+                                    eye_order=order,
+                                    eye_order_source=(
+                                        f'ffprobe stream {stream_index} Stereo3D'))
+
+                    tags = stream.get('tags')
+                    if tags:
                         for key, value in tags.items():
                             if key.lower().startswith('stereo'):
                                 classified = _classify_stereo_mode(value)
@@ -491,13 +672,7 @@ class Video3DAnalyzer:
                                         eye_order_source=(
                                             f'ffprobe stream {stream_index} tag {key}'))
 
-            if not result['has_mvc_track']:
-                for stream in data.get('streams', []):
-                    if stream.get('codec_name') == 'mvc':
-                        result['is_3d'] = True
-                        result['has_mvc_track'] = True
-                        result['stereo_mode'] = 'mvc'
-                        break
+            result['has_audio'] = has_audio
 
             # Genuine MVC-in-Matroska recovery: a single H.264 track carrying the
             # base + dependent views (mkvmerge BD3D remux) has no ffprobe-visible
@@ -517,18 +692,14 @@ class Video3DAnalyzer:
                     result['stereo_mode'] = 'mvc'
                     result['has_mvc_track'] = True
 
-            if not result['duration']:
-                for stream in data.get('streams', []):
-                    dur = stream.get('duration')
-                    if dur:
-                        try:
-                            result['duration'] = float(dur)
-                            break
-                        except ValueError:
-                            continue
+            if not result['duration'] and fallback_duration is not None:
+                result['duration'] = fallback_duration
 
         except subprocess.CalledProcessError as e:
-            error_output = (e.stderr or e.stdout or '').strip()
+            error_output = (e.stderr or e.stdout or b'')
+            if isinstance(error_output, bytes):
+                error_output = error_output.decode('utf-8', 'replace')
+            error_output = error_output.strip()
             message = error_output if error_output else str(e)
             print(f"Error during 3D analysis (ffprobe): {message}")
             hint = _describe_windows_returncode(e.returncode)
@@ -20,9 +20,6 @@ class WindowPresentationMixin:
             return bool(hud.desired_visible)
         if not self.controls_overlay.isVisible():
             return False
-        eff = self.controls_overlay.graphicsEffect()
-        if eff and eff.opacity() < 0.1:
-            return False
         if self.controls_overlay.windowOpacity() < 0.1:
             return False
         return True
@@ -99,9 +96,26 @@ class WindowPresentationMixin:
             pass
         return False
 
+    def _set_nav_cursor(self, shape):
+        """setCursor only on a real shape change — show/hide_controls run on
+        every activity edge and cursor changes are OS calls, not cheap Qt state."""
+        if getattr(self, '_nav_cursor_shape', None) == shape:
+            return
+        self._nav_cursor_shape = shape
+        self.setCursor(shape)
+
     def _mark_activity(self):
-        """Register mouse activity inside the window: show the bar and reset the idle clock."""
-        self._nav_last_activity = time.monotonic()
+        """Register mouse activity inside the window: show the bar and reset the idle clock.
+
+        Runs on every mouse-move event, so the visibility probe is debounced:
+        high-rate moves only refresh the timestamp, and _controls_shown()'s
+        Qt round-trips (visibility/effect/opacity/HUD) happen at most ~10x/s.
+        """
+        now = time.monotonic()
+        self._nav_last_activity = now
+        if now - getattr(self, '_nav_last_show_probe', 0.0) < 0.1:
+            return
+        self._nav_last_show_probe = now
         if not self._controls_shown():
             self.show_controls()
 
@@ -214,11 +228,6 @@ class WindowPresentationMixin:
         self._ensure_controls_timer_initialized()
         self.controls_hide_timer.stop()
 
-        # V14b: Restore opacity and ensure visibility
-        opacity_effect = self.controls_overlay.graphicsEffect()
-        if opacity_effect:
-            opacity_effect.setOpacity(1.0)
-            
         hud = getattr(self, 'stereo_hud', None)
         if hud is not None:
             hud.set_desired_visible(True)
@@ -235,7 +244,7 @@ class WindowPresentationMixin:
                 hud.sync(force=True)
             self.controls_overlay.setWindowOpacity(1.0)
             
-        self.setCursor(Qt.CursorShape.ArrowCursor)
+        self._set_nav_cursor(Qt.CursorShape.ArrowCursor)
 
         # V14b RENDER HEARTBEAT: Stop heartbeat when controls are visible (UI activity is sufficient)
         if self._render_heartbeat_timer.isActive():
@@ -261,15 +270,10 @@ class WindowPresentationMixin:
             hud.set_desired_visible(False)
             
         if hud is None or not hud.active:
-            if self._nav_is_fullscreen():
-                from PySide6.QtWidgets import QGraphicsOpacityEffect
-                opacity_effect = self.controls_overlay.graphicsEffect()
-                if not opacity_effect:
-                    opacity_effect = QGraphicsOpacityEffect(self.controls_overlay)
-                    self.controls_overlay.setGraphicsEffect(opacity_effect)
-                opacity_effect.setOpacity(0.0)
-            else:
-                self.controls_overlay.setWindowOpacity(0.0)
+            # Window-level opacity goes through the compositor for free; a
+            # QGraphicsOpacityEffect here forced the whole bar through an
+            # offscreen render + blend on every paint, fullscreen included.
+            self.controls_overlay.setWindowOpacity(0.0)
         else:
             # HUD actif : On efface la texture 3D du projecteur (et des autres écrans)
             for w in self._display_widgets():
@@ -284,7 +288,7 @@ class WindowPresentationMixin:
             self.controls_overlay.setWindowOpacity(0.0)
 
         # La souris disparaît de l'écran principal
-        self.setCursor(Qt.CursorShape.BlankCursor)
+        self._set_nav_cursor(Qt.CursorShape.BlankCursor)
 
         if (self._nav_is_fullscreen() and not self._render_heartbeat_timer.isActive()
                 and not self.mvc_mode_active and not getattr(self, '_hevc_mode_active', False)):
@@ -745,10 +749,35 @@ class WindowPresentationMixin:
             logger.warning(f"[DROP] {e}")
 
     def resizeEvent(self, event):
-        """Repositions overlays on window resize."""
+        """Repositions overlays on window resize (coalesced)."""
+        # super() first and unconditionally: mpv's embedded surface follows the
+        # layout immediately; only the overlay pass is deferred.
         super().resizeEvent(event)
-        self._update_overlays_geometry()
+        self._schedule_overlays_geometry()
 
+    def moveEvent(self, event):
+        """Repositions overlays on window move (coalesced)."""
+        super().moveEvent(event)
+        self._schedule_overlays_geometry()
+
+    def _schedule_overlays_geometry(self):
+        """Coalesce live resize/move bursts to the trailing edge.
+
+        Dragging a window edge delivers resize events at display rate, and the
+        inline overlay pass (five floating windows, HUD re-capture, mpv zoom
+        resets) ran once per event. One ~frame single-shot applies the settled
+        geometry once per burst instead.
+        """
+        timer = getattr(self, '_overlay_geom_timer', None)
+        if timer is None:
+            timer = self._overlay_geom_timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(16)
+            timer.timeout.connect(self._apply_coalesced_geometry)
+        timer.start()
+
+    def _apply_coalesced_geometry(self):
+        self._update_overlays_geometry()
         # Fix: Safely handle MPV resize commands
         if self.player:
             try:
@@ -758,11 +787,6 @@ class WindowPresentationMixin:
             except Exception:
                 pass
 
-    def moveEvent(self, event):
-        """Repositions overlays on window move."""
-        super().moveEvent(event)
-        self._update_overlays_geometry()
-
     def _update_overlays_geometry(self):
         """Updates the geometry of all floating overlays."""
         if not self.isVisible(): return
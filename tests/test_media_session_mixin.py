@@ -83,6 +83,9 @@ class _Harness(MediaSessionMixin):
     def on_pause_state_change(self, *_args):
         pass
 
+    def on_track_list_change(self, *_args):
+        pass
+
 
 def test_session_ownership_checks_token_core_and_shutdown_state():
     player = _Harness()
@@ -135,8 +138,8 @@ def test_media_observers_are_owned_by_exact_session_and_core():
 
     assert player._install_mpv_media_observers(4, core) is True
     assert [name for name, _handler in core.observed] == [
-        'time-pos', 'duration', 'pause', 'eof-reached']
-    assert len(player._mpv_media_observers) == 4
+        'time-pos', 'duration', 'pause', 'eof-reached', 'track-list']
+    assert len(player._mpv_media_observers) == 5
     assert player._install_mpv_media_observers(3, core) is False
 
 
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import time
+import unittest
+
+from sylc import time_slider
+from sylc.time_slider import _sweep_thumb_cache, _thumb_cache_dir
+
+
+def test_cache_key_tracks_file_mtime():
+    with tempfile.NamedTemporaryFile(suffix='.mkv', delete=False) as fh:
+        path = fh.name
+    try:
+        first = _thumb_cache_dir(path)
+        os.utime(path, (time.time() - 3600, time.time() - 3600))
+        second = _thumb_cache_dir(path)
+        assert first is not None and second is not None
+        assert first != second
+    finally:
+        os.remove(path)
+
+
+def test_missing_file_yields_no_cache_dir():
+    assert _thumb_cache_dir(os.path.join(
+        tempfile.gettempdir(), 'sylc_does_not_exist.mkv')) is None
+
+
+def test_sweep_evicts_oldest_entries_over_cap():
+    with tempfile.TemporaryDirectory() as root:
+        sub = os.path.join(root, 'deadbeef')
+        os.makedirs(sub)
+        old = os.path.join(sub, '1.jpg')
+        new = os.path.join(sub, '2.jpg')
+        for path in (old, new):
+            with open(path, 'wb') as fh:
+                fh.write(b'\xff' * 1024)
+        stale = time.time() - 3600
+        os.utime(old, (stale, stale))
+        saved = time_slider._THUMB_DISK_CACHE_DIR
+        time_slider._THUMB_DISK_CACHE_DIR = root
+        try:
+            _sweep_thumb_cache(cap_bytes=1024)
+        finally:
+            time_slider._THUMB_DISK_CACHE_DIR = saved
+        assert not os.path.exists(old)
+        assert os.path.exists(new)
+
+
+if __name__ == '__main__':
+    tests = [
+        value for name, value in sorted(globals().items())
+        if name.startswith('test_') and callable(value)
+    ]
+    suite = unittest.TestSuite(unittest.FunctionTestCase(test) for test in tests)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    raise SystemExit(0 if result.wasSuccessful() else 1)
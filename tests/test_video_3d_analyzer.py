@@ -1,4 +1,6 @@
+import os
 import subprocess
+import tempfile
 import unittest
 from unittest.mock import patch
 
@@ -44,6 +46,58 @@ def test_permission_failure_never_invents_an_mvc_stream():
     assert result['has_mvc_track'] is False
 
 
+def test_stereo_keyword_classifier_keeps_substring_semantics():
+    assert analyzer._classify_stereo_mode('top-bottom') == 'tab'
+    assert analyzer._classify_stereo_mode('Side By Side') == 'sbs'
+    assert analyzer._classify_stereo_mode('mvc_stereo') == 'mvc'
+    assert analyzer._classify_stereo_mode('red_cyan anaglyph') == 'anaglyph'
+    assert analyzer._classify_stereo_mode('block_bt') == 'tab'
+    assert analyzer._classify_stereo_mode('mono') is None
+    assert analyzer._classify_stereo_mode('') is None
+
+
+def test_batch_analysis_preserves_input_order():
+    with patch.object(analyzer.subprocess, 'run') as run:
+        results = analyzer.Video3DAnalyzer.analyze_files(
+            ['b.ssif', 'a.ssif'])
+
+    run.assert_not_called()
+    assert [r['container_ext'] for r in results] == ['.ssif', '.ssif']
+    assert all(r['stereo_mode'] == 'mvc' for r in results)
+
+
+def test_cached_analysis_skips_reprobe_until_the_file_changes():
+    with tempfile.TemporaryDirectory() as tmp:
+        media = os.path.join(tmp, 'feature.ssif')
+        with open(media, 'wb') as f:
+            f.write(b'x' * 16)
+        saved_env = os.environ.get('SYLC_ANALYSIS_CACHE')
+        os.environ['SYLC_ANALYSIS_CACHE'] = os.path.join(tmp, 'cache.json')
+        analyzer._analysis_cache = None
+        try:
+            first = analyzer.Video3DAnalyzer.analyze_file_cached(media)
+            assert first['stereo_mode'] == 'mvc'
+
+            with patch.object(analyzer.Video3DAnalyzer, 'analyze_file') as probe:
+                hit = analyzer.Video3DAnalyzer.analyze_file_cached(media)
+            probe.assert_not_called()
+            assert hit == first
+
+            # A size change must invalidate the record and re-probe.
+            with open(media, 'wb') as f:
+                f.write(b'y' * 32)
+            with patch.object(analyzer.Video3DAnalyzer, 'analyze_file',
+                              return_value=dict(first)) as probe:
+                analyzer.Video3DAnalyzer.analyze_file_cached(media)
+            probe.assert_called_once_with(media)
+        finally:
+            analyzer._analysis_cache = None
+            if saved_env is None:
+                os.environ.pop('SYLC_ANALYSIS_CACHE', None)
+            else:
+                os.environ['SYLC_ANALYSIS_CACHE'] = saved_env
+
+
 def test_fractional_frame_rate_parser_is_bounded_and_exact():
     assert analyzer._parse_ffprobe_fps('24000/1001') == 24000 / 1001
     assert analyzer._parse_ffprobe_fps('25') == 25.0
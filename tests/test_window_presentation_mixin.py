@@ -8,26 +8,14 @@ from sylc import window_presentation_mixin as presentation_module
 from sylc.window_presentation_mixin import WindowPresentationMixin
 
 
-class _Effect:
-    def __init__(self, opacity=1.0):
-        self._opacity = opacity
-
-    def opacity(self):
-        return self._opacity
-
-
 class _Overlay:
-    def __init__(self, visible=True, opacity=1.0, effect=None):
+    def __init__(self, visible=True, opacity=1.0):
         self._visible = visible
         self._opacity = opacity
-        self._effect = effect
 
     def isVisible(self):
         return self._visible
 
-    def graphicsEffect(self):
-        return self._effect
-
     def windowOpacity(self):
         return self._opacity
 
@@ -157,11 +145,11 @@ def test_controls_shown_respects_hud_requested_visibility():
 
 def test_controls_shown_rejects_transparent_native_overlay():
     player = _Harness()
-    player.controls_overlay = _Overlay(effect=_Effect(0.0))
+    player.controls_overlay = _Overlay(opacity=0.0)
 
     assert player._controls_shown() is False
 
-    player.controls_overlay = _Overlay(opacity=0.0)
+    player.controls_overlay = _Overlay(visible=False)
     assert player._controls_shown() is False
 
 